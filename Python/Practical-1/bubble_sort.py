@@ -2,9 +2,26 @@
 # Time Complexity: O(n^2)
 # Space Complexity: O(1)
 
-def bubble_sort(arr):
-    """Sort array using Bubble Sort algorithm"""
+import numpy as np
+
+
+def bubble_sort(arr, count=True):
+    """
+    Sort array using Bubble Sort algorithm
+    count=False skips the counters in the inner loop and returns (None, None)
+    """
     n = len(arr)
+    if not count:
+        for i in range(n):
+            swapped = False
+            for j in range(0, n - i - 1):
+                if arr[j] > arr[j + 1]:
+                    arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                    swapped = True
+            if not swapped:
+                break
+        return None, None
+    
     comparisons = 0
     swaps = 0
     
@@ -25,6 +42,40 @@ def bubble_sort(arr):
     return comparisons, swaps
 
 
+def bubble_sort_numpy(arr, count=True):
+    """
+    Bubble sort for NumPy arrays / array.array (any writable buffer), in place
+    Odd-even transposition: each phase compares and swaps every pair
+    (0,1), (2,3), ... or (1,2), (3,4), ... at once, so the inner loop runs
+    in NumPy. Swaps equal the scalar version (both = number of inversions);
+    comparisons are counted per pair looked at.
+    Returns: (comparisons, swaps), or (None, None) with count=False
+    """
+    a = np.asarray(memoryview(arr))
+    n = len(a)
+    comparisons = 0
+    swaps = 0
+    
+    changed = n > 1
+    while changed:
+        changed = False
+        for start in (0, 1):
+            m = (n - start) // 2
+            left = a[start:start + 2 * m:2]
+            right = a[start + 1:start + 2 * m:2]
+            out_of_order = left > right
+            if out_of_order.any():
+                low = np.minimum(left, right)
+                right[:] = np.maximum(left, right)
+                left[:] = low
+                changed = True
+                if count:
+                    swaps += int(np.count_nonzero(out_of_order))
+            comparisons += m
+    
+    return (comparisons, swaps) if count else (None, None)
+
+
 def main():
     print("=== Bubble Sort ===\n")
     
@@ -2,24 +2,41 @@
 # Time Complexity: O(n^2)
 # Space Complexity: O(1)
 
-def insertion_sort(arr):
-    """Sort array using Insertion Sort algorithm"""
-    n = len(arr)
+from bisect import bisect_right
+
+
+def insertion_sort(arr, low=0, high=None, count=True):
+    """
+    Sort array using Insertion Sort algorithm (only arr[low..high] if given)
+    count=False skips the counters in the inner loop and returns (None, None)
+    """
+    if high is None:
+        high = len(arr) - 1
+    if not count:
+        for i in range(low + 1, high + 1):
+            key = arr[i]
+            j = i - 1
+            while j >= low and arr[j] > key:
+                arr[j + 1] = arr[j]
+                j -= 1
+            arr[j + 1] = key
+        return None, None
+    
     comparisons = 0
     shifts = 0
     
-    for i in range(1, n):
+    for i in range(low + 1, high + 1):
         key = arr[i]
         j = i - 1
         
         # Move elements greater than key one position ahead
-        while j >= 0 and arr[j] > key:
+        while j >= low and arr[j] > key:
             comparisons += 1
             arr[j + 1] = arr[j]
             shifts += 1
             j -= 1
         
-        if j >= 0:
+        if j >= low:
             comparisons += 1
         
         arr[j + 1] = key
@@ -27,6 +44,42 @@ def insertion_sort(arr):
     return comparisons, shifts
 
 
+def binary_insertion_sort(arr, low=0, high=None, count=True):
+    """
+    Insertion Sort that finds each slot by binary search (bisect_right, so
+    equal keys keep their order) and moves the larger elements with one slice
+    assignment instead of one shift at a time.
+    Works on lists, array.array and NumPy arrays (only arr[low..high] if given).
+    Returns: (comparisons, shifts), or (None, None) with count=False
+    """
+    if high is None:
+        high = len(arr) - 1
+    comparisons = 0
+    shifts = 0
+    
+    for i in range(low + 1, high + 1):
+        key = arr[i]
+        if count:
+            # Same search as bisect_right, with the comparisons counted
+            pos, end = low, i
+            while pos < end:
+                mid = (pos + end) // 2
+                comparisons += 1
+                if key < arr[mid]:
+                    end = mid
+                else:
+                    pos = mid + 1
+            shifts += i - pos
+        else:
+            pos = bisect_right(arr, key, low, i)
+        
+        if pos < i:
+            arr[pos + 1:i + 1] = arr[pos:i]
+            arr[pos] = key
+    
+    return (comparisons, shifts) if count else (None, None)
+
+
 def main():
     print("=== Insertion Sort ===\n")
     
@@ -2,9 +2,22 @@
 # Time Complexity: O(n^2)
 # Space Complexity: O(1)
 
-def selection_sort(arr):
-    """Sort array using Selection Sort algorithm"""
+import numpy as np
+
+
+def selection_sort(arr, count=True):
+    """
+    Sort array using Selection Sort algorithm
+    count=False finds each minimum with the built-in min() and returns (None, None)
+    """
     n = len(arr)
+    if not count:
+        for i in range(n):
+            min_idx = min(range(i, n), key=arr.__getitem__)
+            if min_idx != i:
+                arr[i], arr[min_idx] = arr[min_idx], arr[i]
+        return None, None
+    
     comparisons = 0
     swaps = 0
     
@@ -24,6 +37,27 @@ def selection_sort(arr):
     return comparisons, swaps
 
 
+def selection_sort_numpy(arr, count=True):
+    """
+    Selection sort for NumPy arrays / array.array (any writable buffer), in place
+    The minimum search is one argmin per position; counts match selection_sort.
+    Returns: (comparisons, swaps), or (None, None) with count=False
+    """
+    a = np.asarray(memoryview(arr))
+    n = len(a)
+    swaps = 0
+    
+    for i in range(n - 1):
+        min_idx = i + int(a[i:].argmin())
+        if min_idx != i:
+            a[i], a[min_idx] = a[min_idx], a[i]
+            swaps += 1
+    
+    if not count:
+        return None, None
+    return n * (n - 1) // 2, swaps
+
+
 def main():
     print("=== Selection Sort ===\n")
     
@@ -0,0 +1,217 @@
+# External Merge Sort (files larger than memory)
+# Time Complexity: O(n log n) comparisons, O(n log_k(n / M)) I/O for fan-in k, memory M
+# Space Complexity: O(M) memory, O(n) temporary disk
+
+import heapq
+import os
+import tempfile
+import time
+
+import numpy as np
+
+MB = 1 << 20
+# Scratch per merged value in merge_pair: two int64 position arrays
+MERGE_INDEX_BYTES = 16
+
+
+def report(phase, done, total, seconds):
+    """Default progress callback: bytes processed and I/O throughput"""
+    rate = done / MB / seconds if seconds > 0 else 0.0
+    print(f"[{phase}] {done / MB:10.1f} / {total / MB:.1f} MB  {rate:8.1f} MB/s")
+
+
+def create_runs(input_path, tmp_dir, dtype, chunk_items, progress=None):
+    """
+    Phase 1: read chunks with numpy.fromfile, sort each in memory, spill to a temp file
+    Returns: list of run file paths
+    """
+    itemsize = np.dtype(dtype).itemsize
+    total = os.path.getsize(input_path)
+    runs = []
+    done = 0
+    start = time.perf_counter()
+
+    with open(input_path, "rb") as f:
+        while True:
+            chunk = np.fromfile(f, dtype=dtype, count=chunk_items)
+            if chunk.size == 0:
+                break
+            # In place (introsort): equal numbers are identical, stability buys nothing
+            chunk.sort()
+            path = os.path.join(tmp_dir, f"run{len(runs):05}.bin")
+            chunk.tofile(path)
+            runs.append(path)
+            done += chunk.size * itemsize
+            # Free the chunk before the next read allocates one
+            del chunk
+            if progress:
+                progress("runs", done, total, time.perf_counter() - start)
+    return runs
+
+
+class RunReader:
+    """Sorted run on disk, read one block at a time"""
+    def __init__(self, path, dtype, block_items):
+        self.file = open(path, "rb")
+        self.dtype = dtype
+        self.block_items = block_items
+        self.block = None
+        self.refill()
+
+    def refill(self):
+        """Load the next block; False once the run is exhausted"""
+        self.block = np.fromfile(self.file, dtype=self.dtype, count=self.block_items)
+        if self.block.size == 0:
+            self.file.close()
+            return False
+        return True
+
+
+def merge_pair(a, b):
+    """
+    Stable merge of two sorted arrays (a's items first on ties)
+    Each item's output slot is its own index plus the number of items of the
+    other run that go before it - the binary search merge_runs gallops with,
+    done for every item at once.
+    """
+    merged = np.empty(a.size + b.size, dtype=a.dtype)
+    merged[np.arange(a.size) + np.searchsorted(b, a, side="left")] = a
+    merged[np.arange(b.size) + np.searchsorted(a, b, side="right")] = b
+    return merged
+
+
+def merge_pieces(pieces):
+    """k-way merge of sorted arrays by pairwise passes, as in merge_sort_bottom_up"""
+    while len(pieces) > 1:
+        pieces = [merge_pair(pieces[i], pieces[i + 1]) if i + 1 < len(pieces) else pieces[i]
+                  for i in range(0, len(pieces), 2)]
+    return pieces[0]
+
+
+def merge_files(run_paths, output_path, dtype, block_items, progress=None, done=0, total=0,
+                start=None, phase="merge"):
+    """
+    k-way merge of sorted run files into output_path
+    A heap keyed on the last value of each run's current block gives the
+    smallest block tail `bound`. Everything <= bound in every buffer is
+    final, so it is taken with searchsorted, merged (merge_pieces) and
+    written at once; the run(s) whose block ended at bound read their next
+    block. A step takes at most one block per run, so its output is at most
+    len(run_paths) * block_items values.
+    Returns: bytes written
+    """
+    itemsize = np.dtype(dtype).itemsize
+    start = time.perf_counter() if start is None else start
+    readers = [RunReader(path, dtype, block_items) for path in run_paths]
+    heap = [(r.block[-1], i) for i, r in enumerate(readers) if r.block.size]
+    heapq.heapify(heap)
+    # Progress about once per fan_in blocks written
+    report_bytes = len(readers) * block_items * itemsize
+    reported = done
+
+    with open(output_path, "wb", buffering=0) as out:
+        while heap:
+            bound = heap[0][0]
+            pieces = []
+            for r in readers:
+                if r.block is not None and r.block.size:
+                    cut = np.searchsorted(r.block, bound, side="right")
+                    if cut:
+                        pieces.append(r.block[:cut])
+                        r.block = r.block[cut:]
+            merged = merge_pieces(pieces)
+            del pieces
+            # Unbuffered: one write call per step, no copy into a file buffer
+            out.write(memoryview(merged).cast("B"))
+            done += merged.size * itemsize
+            del merged
+
+            # Every run whose block tail was bound is now empty: read on
+            emptied = []
+            while heap and heap[0][0] == bound:
+                emptied.append(heapq.heappop(heap)[1])
+            for i in emptied:
+                if readers[i].refill():
+                    heapq.heappush(heap, (readers[i].block[-1], i))
+
+            if progress and (done - reported >= report_bytes or not heap):
+                progress(phase, done, total, time.perf_counter() - start)
+                reported = done
+    return done
+
+
+def external_sort(input_path, output_path, dtype=np.int64, memory_bytes=256 * MB, fan_in=64,
+                  tmp_dir=None, progress=report):
+    """
+    Sort a binary file of fixed-width numbers that may not fit in memory
+    memory_bytes: budget for one in-memory chunk, and for all merge buffers
+    fan_in:       runs merged at once; more runs need extra merge passes
+    progress:     callback(phase, bytes done, bytes total, seconds) or None
+    Returns: (items sorted, initial runs, merge passes)
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    itemsize = np.dtype(dtype).itemsize
+    total = os.path.getsize(input_path)
+    chunk_items = max(memory_bytes // itemsize, 1)
+    # A merge step holds one block per run, its output (at most fan_in blocks),
+    # the previous pairwise merge level and two int64 index arrays
+    block_items = max(memory_bytes // (fan_in * (3 * itemsize + MERGE_INDEX_BYTES)), 1)
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as tmp:
+        runs = create_runs(input_path, tmp, dtype, chunk_items, progress)
+        initial_runs = len(runs)
+        passes = 0
+        if not runs:
+            open(output_path, "wb").close()
+
+        while runs:
+            passes += 1
+            start = time.perf_counter()
+            final = len(runs) <= fan_in
+            next_runs = []
+            done = 0
+            for g in range(0, len(runs), fan_in):
+                group = runs[g:g + fan_in]
+                target = output_path if final else os.path.join(tmp, f"pass{passes}_{g:05}.bin")
+                done = merge_files(group, target, dtype, block_items, progress,
+                                   done, total, start, f"merge pass {passes}")
+                for path in group:
+                    os.remove(path)
+                next_runs.append(target)
+            runs = [] if final else next_runs
+
+    return total // itemsize, initial_runs, passes
+
+
+def main():
+    print("=== External Merge Sort ===\n")
+
+    # Input
+    n = int(input("Enter number of random int64 values to generate: "))
+    memory_mb = float(input("Enter memory budget (MB): "))
+    fan_in = int(input("Enter fan-in (runs merged at once): "))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = os.path.join(tmp, "input.bin")
+        output_path = os.path.join(tmp, "sorted.bin")
+        rng = np.random.default_rng()
+        rng.integers(-2**62, 2**62, size=n, dtype=np.int64).tofile(input_path)
+
+        # Sort
+        start = time.perf_counter()
+        items, runs, passes = external_sort(input_path, output_path,
+                                            memory_bytes=int(memory_mb * MB), fan_in=fan_in)
+        end = time.perf_counter()
+
+        result = np.fromfile(output_path, dtype=np.int64)
+        print(f"\nItems sorted: {items}")
+        print(f"Initial runs: {runs}")
+        print(f"Merge passes: {passes}")
+        print(f"Sorted correctly: {bool(np.all(result[:-1] <= result[1:]))}")
+        print(f"Time taken: {end - start:.2f} seconds")
+        print(f"Throughput: {items * 8 / MB / (end - start):.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,51 +4,69 @@
 
 import time
 
-def heapify(arr, n, i):
-    """Convert subtree rooted at i into a max heap"""
+def heapify(arr, n, i, low=0):
+    """
+    Convert subtree rooted at i into a max heap
+    The heap is arr[low:low + n]; i is an index relative to low.
+    Returns: (comparisons, swaps)
+    """
     largest = i
     left = 2 * i + 1
     right = 2 * i + 2
     comparisons = 0
+    swaps = 0
     
     # Check if left child exists and is greater
     if left < n:
         comparisons += 1
-        if arr[left] > arr[largest]:
+        if arr[low + left] > arr[low + largest]:
             largest = left
     
     # Check if right child exists and is greater
     if right < n:
         comparisons += 1
-        if arr[right] > arr[largest]:
+        if arr[low + right] > arr[low + largest]:
             largest = right
     
     # Swap and heapify if needed
     if largest != i:
-        arr[i], arr[largest] = arr[largest], arr[i]
-        comparisons += heapify(arr, n, largest)
+        arr[low + i], arr[low + largest] = arr[low + largest], arr[low + i]
+        comp, swap = heapify(arr, n, largest, low)
+        comparisons += comp
+        swaps += swap + 1
     
-    return comparisons
+    return comparisons, swaps
 
 
-def heap_sort(arr):
-    """Sort array using Heap Sort"""
-    n = len(arr)
+def heap_sort(arr, low=0, high=None):
+    """
+    Sort array using Heap Sort (only arr[low..high] if given)
+    Returns: (comparisons, swaps)
+    """
+    if high is None:
+        high = len(arr) - 1
+    n = high - low + 1
     comparisons = 0
+    swaps = 0
     
     # Build max heap
     for i in range(n // 2 - 1, -1, -1):
-        comparisons += heapify(arr, n, i)
+        comp, swap = heapify(arr, n, i, low)
+        comparisons += comp
+        swaps += swap
     
     # Extract elements from heap one by one
     for i in range(n - 1, 0, -1):
         # Move current root to end
-        arr[0], arr[i] = arr[i], arr[0]
+        arr[low], arr[low + i] = arr[low + i], arr[low]
+        swaps += 1
         
         # Heapify the reduced heap
-        comparisons += heapify(arr, i, 0)
+        comp, swap = heapify(arr, i, 0, low)
+        comparisons += comp
+        swaps += swap
     
-    return comparisons
+    return comparisons, swaps
 
 
 def main():
@@ -65,11 +83,12 @@ def main():
     
     # Sort
     start = time.perf_counter()
-    comparisons = heap_sort(arr)
+    comparisons, swaps = heap_sort(arr)
     end = time.perf_counter()
     
     print(f"Sorted array: {arr}")
     print(f"\nTotal comparisons: {comparisons}")
+    print(f"Total swaps: {swaps}")
     print(f"Time taken: {(end - start) * 1000000:.2f} microseconds")
     print(f"Time Complexity: O(n log n) = O({n} log {n})")
 
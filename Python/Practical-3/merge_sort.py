@@ -2,8 +2,12 @@
 # Time Complexity: O(n log n)
 # Space Complexity: O(n)
 
+import random
 import time
 
+# Wins in a row before merge switches to galloping (as in TimSort)
+MIN_GALLOP = 7
+
 def merge(arr, left, mid, right):
     """Merge two sorted subarrays"""
     # Create temporary arrays
@@ -56,6 +60,224 @@ def merge_sort(arr, left, right):
     return comparisons
 
 
+def min_run_length(n):
+    """TimSort minimum run: between 32 and 64 so n / min_run is close to a power of 2"""
+    extra = 0
+    while n >= 64:
+        extra |= n & 1
+        n >>= 1
+    return n + extra
+
+
+def extend_run(arr, lo, start, hi):
+    """
+    Binary insertion of arr[start:hi] into the sorted run arr[lo:start]
+    A bisect_right search finds each slot in O(log n) comparisons; one slice
+    assignment moves the larger elements up.
+    Returns: number of comparisons
+    """
+    comparisons = 0
+    for i in range(start, hi):
+        key = arr[i]
+        # Same search as bisect_right, with the comparisons counted
+        pos, end = lo, i
+        while pos < end:
+            mid = (pos + end) // 2
+            comparisons += 1
+            if key < arr[mid]:
+                end = mid
+            else:
+                pos = mid + 1
+        arr[pos + 1:i + 1] = arr[pos:i]
+        arr[pos] = key
+    return comparisons
+
+
+def find_runs(arr, min_run):
+    """
+    Split arr into sorted runs: ascending runs are kept, strictly descending
+    ones reversed in place (strict keeps the sort stable), and short runs are
+    extended to min_run elements with binary insertion.
+    Returns: (run boundaries [0, ..., n], comparisons)
+    """
+    n = len(arr)
+    bounds = [0]
+    comparisons = 0
+    lo = 0
+    
+    while lo < n:
+        hi = lo + 1
+        if hi < n:
+            comparisons += 1
+            if arr[hi] < arr[lo]:
+                # Strictly descending run
+                while hi + 1 < n and arr[hi + 1] < arr[hi]:
+                    comparisons += 1
+                    hi += 1
+                arr[lo:hi + 1] = arr[lo:hi + 1][::-1]
+            else:
+                while hi + 1 < n and arr[hi + 1] >= arr[hi]:
+                    comparisons += 1
+                    hi += 1
+            comparisons += hi + 1 < n
+            hi += 1
+        
+        if hi - lo < min_run and hi < n:
+            end = min(lo + min_run, n)
+            comparisons += extend_run(arr, lo, hi, end)
+            hi = end
+        bounds.append(hi)
+        lo = hi
+    
+    return bounds, comparisons
+
+
+def gallop(a, key, lo, hi, right):
+    """
+    First index p in a[lo:hi] with a[p] > key (right=True) or a[p] >= key
+    (right=False); probes at lo, lo+1, lo+3, lo+7, ... then binary search
+    Returns: (p, comparisons)
+    """
+    comparisons = 0
+    last, offset = lo, 1
+    while lo + offset - 1 < hi:
+        comparisons += 1
+        x = a[lo + offset - 1]
+        if (x > key) if right else (x >= key):
+            break
+        last = lo + offset
+        offset *= 2
+    high = min(lo + offset - 1, hi)
+    
+    while last < high:
+        mid = (last + high) // 2
+        comparisons += 1
+        x = a[mid]
+        if (x > key) if right else (x >= key):
+            high = mid
+        else:
+            last = mid + 1
+    return last, comparisons
+
+
+def merge_runs(src, dst, lo, mid, hi):
+    """
+    Merge runs src[lo:mid] and src[mid:hi] into dst[lo:hi] (stable)
+    After MIN_GALLOP wins in a row for one side, the rest of its winning
+    stretch is found by galloping and copied as one slice.
+    Returns: number of comparisons
+    """
+    comparisons = 1
+    if src[mid - 1] <= src[mid]:
+        # Already in order
+        dst[lo:hi] = src[lo:hi]
+        return comparisons
+    
+    i, j, k = lo, mid, lo
+    left_wins = right_wins = 0
+    while i < mid and j < hi:
+        comparisons += 1
+        if src[i] <= src[j]:
+            dst[k] = src[i]
+            i += 1
+            k += 1
+            left_wins += 1
+            right_wins = 0
+            if left_wins >= MIN_GALLOP:
+                # Every left element <= src[j] goes next
+                end, comp = gallop(src, src[j], i, mid, right=True)
+                comparisons += comp
+                dst[k:k + end - i] = src[i:end]
+                k += end - i
+                i = end
+                left_wins = 0
+        else:
+            dst[k] = src[j]
+            j += 1
+            k += 1
+            right_wins += 1
+            left_wins = 0
+            if right_wins >= MIN_GALLOP and i < mid:
+                # Every right element < src[i] goes next
+                end, comp = gallop(src, src[i], j, hi, right=False)
+                comparisons += comp
+                dst[k:k + end - j] = src[j:end]
+                k += end - j
+                j = end
+                right_wins = 0
+    
+    # Copy whichever run is left over
+    if i < mid:
+        dst[k:hi] = src[i:mid]
+    else:
+        dst[k:hi] = src[j:hi]
+    return comparisons
+
+
+def merge_sort_bottom_up(arr):
+    """
+    Iterative (bottom-up) natural Merge Sort
+    Starts from the runs already in the data and merges neighbours pass by
+    pass. One auxiliary buffer is allocated; each pass writes from one buffer
+    into the other, so nothing is copied back until the end (at most once).
+    Returns: number of comparisons
+    """
+    n = len(arr)
+    if n < 2:
+        return 0
+    bounds, comparisons = find_runs(arr, min_run_length(n))
+    
+    src, dst = arr, [None] * n
+    while len(bounds) > 2:
+        merged = [0]
+        for r in range(0, len(bounds) - 1, 2):
+            lo = bounds[r]
+            if r + 2 < len(bounds):
+                mid, hi = bounds[r + 1], bounds[r + 2]
+                comparisons += merge_runs(src, dst, lo, mid, hi)
+            else:
+                # Odd run out: carry it over to the other buffer
+                hi = bounds[r + 1]
+                dst[lo:hi] = src[lo:hi]
+            merged.append(hi)
+        bounds = merged
+        src, dst = dst, src
+    
+    if src is not arr:
+        arr[:] = src
+    return comparisons
+
+
+def benchmark(sizes=(10**5, 10**6, 10**7), seed=0):
+    """
+    Time merge_sort vs merge_sort_bottom_up on random, nearly-sorted and
+    reversed lists (pure Python: 10^7 elements takes minutes per run)
+    Returns: list of (kind, n, recursive seconds, bottom-up seconds)
+    """
+    rng = random.Random(seed)
+    results = []
+    for n in sizes:
+        nearly = list(range(n))
+        for _ in range(n // 100):
+            a, b = rng.randrange(n), rng.randrange(n)
+            nearly[a], nearly[b] = nearly[b], nearly[a]
+        inputs = {
+            "random": [rng.random() for _ in range(n)],
+            "nearly-sorted": nearly,
+            "reversed": list(range(n, 0, -1)),
+        }
+        for kind, data in inputs.items():
+            times = []
+            for sort in (lambda a: merge_sort(a, 0, len(a) - 1), merge_sort_bottom_up):
+                arr = data.copy()
+                start = time.perf_counter()
+                sort(arr)
+                times.append(time.perf_counter() - start)
+            results.append((kind, n, times[0], times[1]))
+            print(f"{kind:14} n={n:<9} recursive {times[0]:8.2f}s   bottom-up {times[1]:8.2f}s")
+    return results
+
+
 def main():
     print("=== Merge Sort (Divide and Conquer) ===\n")
     
@@ -67,6 +289,7 @@ def main():
         arr.append(int(input(f"Element {i + 1}: ")))
     
     print(f"\nOriginal array: {arr}")
+    bottom_up_arr = arr.copy()
     
     # Sort
     start = time.perf_counter()
@@ -77,6 +300,16 @@ def main():
     print(f"\nTotal comparisons: {comparisons}")
     print(f"Time taken: {(end - start) * 1000000:.2f} microseconds")
     print(f"Time Complexity: O(n log n) = O({n} log {n})")
+    
+    # Bottom-up natural merge sort on the same input
+    start = time.perf_counter()
+    comparisons = merge_sort_bottom_up(bottom_up_arr)
+    end = time.perf_counter()
+    
+    print("\n=== Bottom-up Natural Merge Sort ===")
+    print(f"Sorted array: {bottom_up_arr}")
+    print(f"\nTotal comparisons: {comparisons}")
+    print(f"Time taken: {(end - start) * 1000000:.2f} microseconds")
 
 
 if __name__ == "__main__":
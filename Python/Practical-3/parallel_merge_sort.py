@@ -0,0 +1,158 @@
+# Parallel Merge Sort (shared memory + sample-pivot multiway merge)
+# Time Complexity: O((n log n) / p + p^2 log n) with p worker processes
+# Space Complexity: O(n) shared memory (input + output buffers)
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Regular samples taken from each sorted segment to choose merge pivots
+SAMPLES_PER_SEGMENT = 64
+
+# Per-process views of the shared buffers (set once by the pool initializer)
+_shared_state = {}
+
+
+def _init_sort_worker(src_name, dst_name, n):
+    src = shared_memory.SharedMemory(name=src_name)
+    dst = shared_memory.SharedMemory(name=dst_name)
+    _shared_state["blocks"] = (src, dst)  # keep the mappings alive
+    _shared_state["src"] = np.ndarray(n, dtype=np.int64, buffer=src.buf)
+    _shared_state["dst"] = np.ndarray(n, dtype=np.int64, buffer=dst.buf)
+
+
+def _sort_segment(lo, hi):
+    """Sort src[lo:hi] in place, returns regular samples of the sorted segment"""
+    segment = _shared_state["src"][lo:hi]
+    segment.sort(kind="mergesort")
+    if hi - lo == 0:
+        return np.empty(0, dtype=np.int64)
+    picks = np.linspace(0, hi - lo - 1, min(SAMPLES_PER_SEGMENT, hi - lo)).astype(np.int64)
+    return segment[picks].copy()
+
+
+def _merge_pieces(pieces, out_lo):
+    """Merge the sorted pieces src[a:b] into dst starting at out_lo"""
+    src, dst = _shared_state["src"], _shared_state["dst"]
+    merged = np.concatenate([src[a:b] for a, b in pieces])
+    # Stable sort on concatenated sorted runs is a run-detecting merge
+    merged.sort(kind="mergesort")
+    dst[out_lo:out_lo + merged.size] = merged
+
+
+def segment_bounds(n, parts):
+    """Split range(n) into parts nearly equal [lo, hi) segments"""
+    edges = np.linspace(0, n, parts + 1).astype(np.int64)
+    return list(zip(edges[:-1].tolist(), edges[1:].tolist()))
+
+
+def choose_pivots(samples, parts):
+    """parts - 1 pivots spread evenly over the pooled, sorted samples"""
+    pooled = np.sort(np.concatenate(samples))
+    if pooled.size == 0:
+        return np.empty(0, dtype=np.int64)
+    picks = (np.arange(1, parts) * pooled.size) // parts
+    return pooled[picks]
+
+
+def plan_merge(src, segments, pivots):
+    """
+    Cut every sorted segment at the pivots (values <= pivot go left)
+    Output partition j gets piece j of every segment, and starts where the
+    previous partitions end, so all partitions can be merged at the same time.
+    Returns: list of (pieces [(a, b), ...], output start)
+    """
+    cuts = [np.concatenate(([lo], lo + np.searchsorted(src[lo:hi], pivots, side="right"), [hi]))
+            for lo, hi in segments]
+    plan = []
+    out_lo = 0
+    for j in range(len(pivots) + 1):
+        pieces = [(int(c[j]), int(c[j + 1])) for c in cuts if c[j + 1] > c[j]]
+        if pieces:
+            # Repeated pivots (many duplicates) leave some partitions empty
+            plan.append((pieces, out_lo))
+            out_lo += sum(b - a for a, b in pieces)
+    return plan
+
+
+def parallel_merge_sort(data, workers=None):
+    """
+    Sort int64 data on a process pool
+    1. data is copied once into a SharedMemory block and split into one
+       segment per worker; workers sort their segment in place
+    2. regular samples of the sorted segments give workers - 1 pivots; each
+       worker merges the pieces between two pivots into its own slice of a
+       second SharedMemory block, so the merge step is parallel too
+    Only segment bounds and shared-memory names are pickled, never the data.
+    Returns: sorted numpy array (identical to a sequential stable sort)
+    """
+    data = np.asarray(data, dtype=np.int64)
+    n = data.size
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or n < 2 * workers:
+        return np.sort(data, kind="mergesort")
+
+    src_block = shared_memory.SharedMemory(create=True, size=max(n * 8, 1))
+    dst_block = shared_memory.SharedMemory(create=True, size=max(n * 8, 1))
+    try:
+        src = np.ndarray(n, dtype=np.int64, buffer=src_block.buf)
+        src[:] = data
+        segments = segment_bounds(n, workers)
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_sort_worker,
+                                 initargs=(src_block.name, dst_block.name, n)) as pool:
+            samples = list(pool.map(_sort_segment, *zip(*segments)))
+            plan = plan_merge(src, segments, choose_pivots(samples, workers))
+            list(pool.map(_merge_pieces, *zip(*plan)))
+
+        result = np.ndarray(n, dtype=np.int64, buffer=dst_block.buf).copy()
+        del src
+    finally:
+        src_block.close()
+        src_block.unlink()
+        dst_block.close()
+        dst_block.unlink()
+    return result
+
+
+def benchmark_parallel(n=10**7, max_workers=None, seed=0):
+    """
+    Print time and speedup of parallel_merge_sort for 1..max_workers workers
+    and check every result is identical to the sequential sort
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    data = np.random.default_rng(seed).integers(-2**62, 2**62, size=n, dtype=np.int64)
+    expected = np.sort(data, kind="mergesort")
+    results = []
+
+    print(f"\nParallel merge sort benchmark, n = {n}")
+    print("-" * 50)
+    print(f"{'Workers':<10} {'Time (s)':<12} {'Speedup':<10} {'Identical':<10}")
+    print("-" * 50)
+    for workers in range(1, max_workers + 1):
+        start = time.perf_counter()
+        result = parallel_merge_sort(data, workers)
+        elapsed = time.perf_counter() - start
+        speedup = results[0][1] / elapsed if results else 1.0
+        identical = bool(np.array_equal(result, expected))
+        results.append((workers, elapsed, speedup, identical))
+        print(f"{workers:<10} {elapsed:<12.3f} {speedup:<10.2f} {identical}")
+    print("-" * 50)
+    return results
+
+
+def main():
+    print("=== Parallel Merge Sort (shared memory) ===\n")
+
+    # Input
+    n = int(input("Enter number of random int64 values: "))
+    max_workers = int(input(f"Enter max workers (cores available: {os.cpu_count()}): "))
+
+    benchmark_parallel(n, max_workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,19 @@
 # Time Complexity: O(n log n) average, O(n^2) worst
 # Space Complexity: O(log n)
 
+import os
+import sys
 import time
+from math import log2
+
+from heap_sort import heap_sort
+
+# binary_insertion_sort lives in Practical-1
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Practical-1"))
+from insertion_sort import binary_insertion_sort  # noqa: E402
+
+# Ranges up to this size are finished by insertion sort
+SMALL_RANGE = 16
 
 def partition(arr, low, high):
     """Partition array and return pivot index"""
@@ -45,6 +57,116 @@ def quick_sort(arr, low, high):
     return comparisons, swaps
 
 
+def median_of_three(arr, a, b, c):
+    """Index of the median of arr[a], arr[b], arr[c] (3 comparisons)"""
+    if arr[a] < arr[b]:
+        if arr[b] < arr[c]:
+            return b, 2
+        return (c, 3) if arr[a] < arr[c] else (a, 3)
+    if arr[a] < arr[c]:
+        return a, 2
+    return (c, 3) if arr[b] < arr[c] else (b, 3)
+
+
+def choose_pivot(arr, low, high):
+    """
+    Median-of-three for small ranges, Tukey's ninther (median of three
+    medians of three) for ranges over 40 elements
+    Returns: (pivot index, comparisons)
+    """
+    mid = (low + high) // 2
+    if high - low + 1 <= 40:
+        return median_of_three(arr, low, mid, high)
+    step = (high - low + 1) // 8
+    comparisons = 0
+    medians = []
+    for centre in (low + step, mid, high - step):
+        index, comp = median_of_three(arr, centre - step, centre, centre + step)
+        medians.append(index)
+        comparisons += comp
+    index, comp = median_of_three(arr, *medians)
+    return index, comparisons + comp
+
+
+def partition_three_way(arr, low, high, pivot_idx):
+    """
+    Dutch national flag partition around arr[pivot_idx]
+    Afterwards arr[low..lt-1] < pivot, arr[lt..gt] == pivot, arr[gt+1..high] > pivot,
+    so runs of duplicates are finished in one pass.
+    Returns: (lt, gt, comparisons, swaps)
+    """
+    pivot = arr[pivot_idx]
+    lt = i = low
+    gt = high
+    comparisons = 0
+    swaps = 0
+    
+    while i <= gt:
+        comparisons += 1
+        if arr[i] < pivot:
+            arr[lt], arr[i] = arr[i], arr[lt]
+            swaps += 1
+            lt += 1
+            i += 1
+        else:
+            comparisons += 1
+            if arr[i] > pivot:
+                arr[i], arr[gt] = arr[gt], arr[i]
+                swaps += 1
+                gt -= 1
+            else:
+                i += 1
+    
+    return lt, gt, comparisons, swaps
+
+
+def introsort(arr, low=0, high=None):
+    """
+    Sort array using Introsort (quick sort + heap sort + insertion sort)
+    - ninther / median-of-three pivot, three-way partition for duplicates
+    - recurse on the smaller side, loop on the larger (O(log n) stack)
+    - heap sort once the depth passes 2 * log2(n): O(n log n) worst case
+    - binary insertion sort for ranges of SMALL_RANGE elements or fewer
+    Returns: (comparisons, swaps), insertion shifts count as swaps
+    """
+    if high is None:
+        high = len(arr) - 1
+    if high <= low:
+        return 0, 0
+    return _introsort(arr, low, high, 2 * int(log2(high - low + 1)))
+
+
+def _introsort(arr, low, high, depth):
+    comparisons = 0
+    swaps = 0
+    
+    while high - low + 1 > SMALL_RANGE:
+        if depth == 0:
+            # Too many bad pivots: finish this range in guaranteed O(n log n)
+            comp, swap = heap_sort(arr, low, high)
+            return comparisons + comp, swaps + swap
+        depth -= 1
+        
+        pivot_idx, comp = choose_pivot(arr, low, high)
+        comparisons += comp
+        lt, gt, comp, swap = partition_three_way(arr, low, high, pivot_idx)
+        comparisons += comp
+        swaps += swap
+        
+        # Recurse into the smaller side, keep looping on the larger one
+        if lt - low < high - gt:
+            comp, swap = _introsort(arr, low, lt - 1, depth)
+            low = gt + 1
+        else:
+            comp, swap = _introsort(arr, gt + 1, high, depth)
+            high = lt - 1
+        comparisons += comp
+        swaps += swap
+    
+    comp, shifts = binary_insertion_sort(arr, low, high)
+    return comparisons + comp, swaps + shifts
+
+
 def main():
     print("=== Quick Sort (Divide and Conquer) ===\n")
     
@@ -56,6 +178,7 @@ def main():
         arr.append(int(input(f"Element {i + 1}: ")))
     
     print(f"\nOriginal array: {arr}")
+    intro_arr = arr.copy()
     
     # Sort
     start = time.perf_counter()
@@ -67,6 +190,18 @@ def main():
     print(f"Total swaps: {swaps}")
     print(f"Time taken: {(end - start) * 1000000:.2f} microseconds")
     print(f"Time Complexity: O(n log n) = O({n} log {n})")
+    
+    # Introsort on the same input
+    start = time.perf_counter()
+    comparisons, swaps = introsort(intro_arr)
+    end = time.perf_counter()
+    
+    print("\n=== Introsort ===")
+    print(f"Sorted array: {intro_arr}")
+    print(f"\nTotal comparisons: {comparisons}")
+    print(f"Total swaps: {swaps}")
+    print(f"Time taken: {(end - start) * 1000000:.2f} microseconds")
+    print(f"Time Complexity: O(n log n) worst case")
 
 
 if __name__ == "__main__":
@@ -2,6 +2,11 @@
 # Time Complexity: O(n log n)
 # Space Complexity: O(n)
 
+import heapq
+
+import numpy as np
+
+
 class Item:
     def __init__(self, value, weight):
         self.value = value
@@ -17,13 +22,13 @@ def fractional_knapsack(items, capacity):
     Solve fractional knapsack using greedy approach
     Returns: (max_value, selected_items)
     """
-    # Sort items by value-to-weight ratio in descending order
-    items.sort(key=lambda x: x.ratio, reverse=True)
+    # Sort items by value-to-weight ratio in descending order (caller's list untouched)
+    sorted_items = sorted(items, key=lambda x: x.ratio, reverse=True)
     
     max_value = 0
     selected = []
     
-    for item in items:
+    for item in sorted_items:
         if capacity >= item.weight:
             # Take entire item
             capacity -= item.weight
@@ -39,6 +44,137 @@ def fractional_knapsack(items, capacity):
     return max_value, selected
 
 
+class ItemColumns:
+    """Value, weight and ratio columns stored as contiguous NumPy arrays"""
+    def __init__(self, values, weights):
+        self.values = np.asarray(values, dtype=np.float64)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.ratios = self.values / self.weights
+
+    @classmethod
+    def from_items(cls, items):
+        return cls([item.value for item in items], [item.weight for item in items])
+
+    def __len__(self):
+        return len(self.values)
+
+
+def fractional_knapsack_select(columns, capacity, rng=None):
+    """
+    Fractional knapsack in O(n) expected time (no full sort)
+    Quickselect on ratio finds the critical item: everything with a higher
+    ratio is taken whole, the critical item is taken partly, the rest not at all.
+    Returns: (max_value, selected) where selected is [(index, fraction), ...]
+    """
+    rng = rng or np.random.default_rng()
+    candidates = np.arange(len(columns))
+    remaining = capacity
+    max_value = 0.0
+    taken = []
+
+    while candidates.size and remaining > 0:
+        ratios = columns.ratios[candidates]
+        pivot = ratios[rng.integers(candidates.size)]
+
+        # Three-way partition around the pivot ratio
+        higher = candidates[ratios > pivot]
+        equal = candidates[ratios == pivot]
+        lower = candidates[ratios < pivot]
+
+        higher_weight = columns.weights[higher].sum()
+        if higher_weight > remaining:
+            # Critical item has a higher ratio than pivot
+            candidates = higher
+            continue
+
+        # Take every higher-ratio item whole
+        remaining -= higher_weight
+        max_value += columns.values[higher].sum()
+        taken.extend((i, 1.0) for i in higher.tolist())
+
+        # Items with ratio == pivot are interchangeable, fill in index order
+        for i in equal.tolist():
+            weight = columns.weights[i]
+            if weight <= remaining:
+                remaining -= weight
+                max_value += columns.values[i]
+                taken.append((i, 1.0))
+            else:
+                fraction = remaining / weight
+                max_value += columns.values[i] * fraction
+                taken.append((i, fraction))
+                remaining = 0
+                break
+
+        candidates = lower
+
+    return float(max_value), taken
+
+
+def fractional_knapsack_heap(columns, capacity):
+    """
+    Streaming fractional knapsack using a max-heap on ratio
+    Heapify is O(n); pops stop as soon as the knapsack is full,
+    so total time is O(n + k log n) for k items taken.
+    Returns: (max_value, selected) where selected is [(index, fraction), ...]
+    """
+    heap = list(zip((-columns.ratios).tolist(), range(len(columns))))
+    heapq.heapify(heap)
+
+    max_value = 0.0
+    selected = []
+    while heap and capacity > 0:
+        _, i = heapq.heappop(heap)
+        weight = columns.weights[i]
+        if capacity >= weight:
+            capacity -= weight
+            max_value += columns.values[i]
+            selected.append((i, 1.0))
+        else:
+            fraction = capacity / weight
+            max_value += columns.values[i] * fraction
+            selected.append((i, fraction))
+            break
+
+    return float(max_value), selected
+
+
+class FractionalCatalog:
+    """
+    Item catalog prepared once for many fractional knapsack queries
+    Sorted by ratio once, with prefix sums of weight and value,
+    so each capacity query is a binary search: O(log n)
+    """
+    def __init__(self, columns):
+        order = np.argsort(-columns.ratios, kind="stable")
+        self.order = order
+        self.weights = columns.weights[order]
+        self.values = columns.values[order]
+        self.prefix_weight = np.concatenate(([0.0], np.cumsum(self.weights)))
+        self.prefix_value = np.concatenate(([0.0], np.cumsum(self.values)))
+
+    def query(self, capacity):
+        """Maximum fractional value for a single capacity"""
+        return float(self.query_many(np.array([capacity]))[0])
+
+    def query_many(self, capacities):
+        """Maximum fractional value for every capacity in a NumPy array"""
+        capacities = np.maximum(np.asarray(capacities, dtype=np.float64), 0.0)
+        n = len(self.weights)
+        if n == 0:
+            return np.zeros_like(capacities)
+
+        # Items [0, k) fit whole; item k (if any) is taken partly
+        k = np.searchsorted(self.prefix_weight, capacities, side="right") - 1
+        result = self.prefix_value[k]
+
+        partial = k < n
+        critical = np.minimum(k, n - 1)
+        fraction = (capacities - self.prefix_weight[k]) / self.weights[critical]
+        result += np.where(partial, self.values[critical] * fraction, 0.0)
+        return result
+
+
 def main():
     print("=== Fractional Knapsack Problem (Greedy) ===\n")
     
@@ -62,7 +198,7 @@ def main():
     print("SOLUTION:")
     print("="*50)
     print("\nItems sorted by value/weight ratio:")
-    for item in items:
+    for item in sorted(items, key=lambda x: x.ratio, reverse=True):
         print(f"  Value: {item.value}, Weight: {item.weight}, Ratio: {item.ratio:.2f}")
     
     print("\nSelected items:")
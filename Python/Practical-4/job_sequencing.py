@@ -1,7 +1,11 @@
 # Job Sequencing with Deadlines using Greedy Algorithm
-# Time Complexity: O(n^2)
+# Time Complexity: O(n log n) (sorting + union-find slot allocation)
 # Space Complexity: O(n)
 
+import heapq
+from itertools import count
+
+
 class Job:
     def __init__(self, job_id, deadline, profit):
         self.id = job_id
@@ -12,6 +16,32 @@ class Job:
         return f"(J{self.id}, D:{self.deadline}, P:{self.profit})"
 
 
+class SlotAllocator:
+    """
+    Disjoint-set "latest free slot" allocator
+    find(t) returns the latest free slot <= t (0 means none is free).
+    Taking slot s links it to s - 1, with path compression.
+    """
+    def __init__(self, num_slots):
+        self.parent = list(range(num_slots + 1))
+
+    def find(self, slot):
+        root = slot
+        while self.parent[root] != root:
+            root = self.parent[root]
+        # Path compression
+        while self.parent[slot] != root:
+            self.parent[slot], slot = root, self.parent[slot]
+        return root
+
+    def allocate(self, deadline):
+        """Take the latest free slot <= deadline, returns it (0 if none)"""
+        slot = self.find(deadline)
+        if slot > 0:
+            self.parent[slot] = slot - 1
+        return slot
+
+
 def job_sequencing(jobs):
     """
     Solve job sequencing with deadlines using greedy approach
@@ -20,27 +50,178 @@ def job_sequencing(jobs):
     # Sort jobs by profit in descending order
     jobs.sort(key=lambda x: x.profit, reverse=True)
     
-    # Find maximum deadline
-    max_deadline = max(job.deadline for job in jobs)
-    
-    # Create time slots
-    slots = [-1] * max_deadline
+    # At most n jobs can run, so deadlines beyond n behave exactly like n
+    # (compressing them keeps memory O(n) even for huge deadlines)
+    num_slots = min(len(jobs), max((job.deadline for job in jobs), default=0))
+    slots = SlotAllocator(num_slots)
     sequence = []
     max_profit = 0
     
     # Schedule jobs
     for job in jobs:
-        # Find a free slot for this job (starting from last possible slot)
-        for slot in range(min(max_deadline, job.deadline) - 1, -1, -1):
-            if slots[slot] == -1:
-                slots[slot] = job.id
-                sequence.append(job)
-                max_profit += job.profit
-                break
+        # Latest free slot before this job's deadline
+        if job.deadline > 0 and slots.allocate(min(num_slots, job.deadline)):
+            sequence.append(job)
+            max_profit += job.profit
     
     return max_profit, sequence
 
 
+class SlackTree:
+    """
+    Segment tree over slots 1..horizon with range add and min
+    slack(t) = t - (number of scheduled jobs with deadline <= t)
+    A job set is feasible while every slack(t) >= 0.
+    """
+    def __init__(self, horizon):
+        self.horizon = horizon
+        self.min = [0] * (4 * horizon)
+        self.lazy = [0] * (4 * horizon)
+        if horizon > 0:
+            self._build(1, 1, horizon)
+
+    def _build(self, node, lo, hi):
+        if lo == hi:
+            self.min[node] = lo
+            return
+        mid = (lo + hi) // 2
+        self._build(2 * node, lo, mid)
+        self._build(2 * node + 1, mid + 1, hi)
+        self.min[node] = min(self.min[2 * node], self.min[2 * node + 1])
+
+    def add(self, left, delta, node=1, lo=1, hi=None):
+        """Add delta to slack(t) for every t in [left, horizon]"""
+        hi = self.horizon if hi is None else hi
+        if hi < left:
+            return
+        if left <= lo:
+            self.min[node] += delta
+            self.lazy[node] += delta
+            return
+        mid = (lo + hi) // 2
+        self.add(left, delta, 2 * node, lo, mid)
+        self.add(left, delta, 2 * node + 1, mid + 1, hi)
+        self.min[node] = min(self.min[2 * node], self.min[2 * node + 1]) + self.lazy[node]
+
+    def first_tight(self, left, node=1, lo=1, hi=None, carry=0):
+        """Smallest t >= left with slack(t) == 0, or 0 if there is none"""
+        hi = self.horizon if hi is None else hi
+        if hi < left or self.min[node] + carry > 0:
+            return 0
+        if lo == hi:
+            return lo
+        carry += self.lazy[node]
+        mid = (lo + hi) // 2
+        return (self.first_tight(left, 2 * node, lo, mid, carry) or
+                self.first_tight(left, 2 * node + 1, mid + 1, hi, carry))
+
+
+class OnlineJobScheduler:
+    """
+    Incremental job sequencing: jobs arrive one at a time
+    Feasible job sets form a matroid, so the best schedule is kept by exchange:
+    place the new job if it fits, otherwise evict the lowest-profit job in the
+    conflicting set (if it earns less), otherwise reject the new job.
+    Deadlines are indexed up to a capacity kept >= the number of jobs offered:
+    no feasible set is larger, so deadlines beyond it behave exactly like it
+    (as in job_sequencing). The capacity doubles when jobs outgrow it, so
+    memory is O(jobs) and each insert is O(log jobs) amortized.
+    """
+    def __init__(self, capacity=1):
+        self.offered = 0
+        self.tie = count()
+        self._reset(max(capacity, 1), [])
+
+    def _reset(self, capacity, jobs):
+        """Build empty trees for deadlines 1..capacity, then place jobs again"""
+        self.capacity = capacity
+        self.slack = SlackTree(capacity)
+        # Min-heap of scheduled jobs per deadline, plus a min segment tree
+        # over deadlines holding each heap's top (profit, deadline)
+        self.by_deadline = {}
+        self.size = 1
+        while self.size < capacity + 1:
+            self.size *= 2
+        self.lowest = [(float("inf"), 0)] * (2 * self.size)
+        self.profit = 0
+        self.count = 0
+        for job in jobs:
+            self._place(job, min(job.deadline, capacity))
+
+    def _refresh(self, deadline):
+        heap = self.by_deadline.get(deadline)
+        pos = self.size + deadline
+        self.lowest[pos] = (heap[0][0], deadline) if heap else (float("inf"), 0)
+        pos //= 2
+        while pos:
+            self.lowest[pos] = min(self.lowest[2 * pos], self.lowest[2 * pos + 1])
+            pos //= 2
+
+    def _lowest_upto(self, right):
+        """(profit, deadline) of the cheapest scheduled job with deadline <= right"""
+        best = (float("inf"), 0)
+        lo, hi = self.size + 1, self.size + right + 1
+        while lo < hi:
+            if lo & 1:
+                best = min(best, self.lowest[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                best = min(best, self.lowest[hi])
+            lo //= 2
+            hi //= 2
+        return best
+
+    def _place(self, job, deadline):
+        heapq.heappush(self.by_deadline.setdefault(deadline, []),
+                       (job.profit, next(self.tie), job))
+        self._refresh(deadline)
+        self.slack.add(deadline, -1)
+        self.profit += job.profit
+        self.count += 1
+
+    def _evict(self, deadline):
+        _, _, job = heapq.heappop(self.by_deadline[deadline])
+        self._refresh(deadline)
+        self.slack.add(deadline, 1)
+        self.profit -= job.profit
+        self.count -= 1
+        return job
+
+    def insert(self, job):
+        """
+        Offer a new job to the schedule
+        Returns: ("placed", None), ("displaced", evicted_job) or ("rejected", job)
+        """
+        if job.deadline <= 0:
+            return "rejected", job
+        self.offered += 1
+        if self.offered > self.capacity:
+            # Still feasible with the larger capacity, and still optimal
+            self._reset(2 * self.capacity, self.schedule())
+        deadline = min(job.deadline, self.capacity)
+
+        tight = self.slack.first_tight(deadline)
+        if not tight:
+            self._place(job, deadline)
+            return "placed", None
+
+        # Jobs due by the first tight slot conflict with the new job
+        lowest_profit, lowest_deadline = self._lowest_upto(tight)
+        if lowest_profit >= job.profit:
+            return "rejected", job
+
+        evicted = self._evict(lowest_deadline)
+        self._place(job, deadline)
+        return "displaced", evicted
+
+    def schedule(self):
+        """Current jobs in execution order (earliest deadline first)"""
+        jobs = [entry[2] for heap in self.by_deadline.values() for entry in heap]
+        jobs.sort(key=lambda x: x.deadline)
+        return jobs
+
+
 def main():
     print("=== Job Sequencing with Deadlines (Greedy) ===\n")
     
@@ -71,7 +252,7 @@ def main():
     
     print(f"\nMaximum profit: {max_profit}")
     print(f"Number of jobs completed: {len(sequence)}")
-    print(f"Time Complexity: O(n^2)")
+    print(f"Time Complexity: O(n log n)")
 
 
 if __name__ == "__main__":
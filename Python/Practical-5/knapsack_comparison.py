@@ -1,6 +1,14 @@
 # Knapsack Comparison: Greedy vs Dynamic Programming
 # Demonstrates that Greedy doesn't always give optimal solution for 0/1 Knapsack
 
+import heapq
+import time
+from bisect import bisect_right
+from itertools import accumulate, count
+
+import numpy as np
+
+
 class Item:
     def __init__(self, value, weight):
         self.value = value
@@ -42,38 +50,81 @@ def knapsack_01_greedy(items, capacity):
     return max_value, selected
 
 
+class KnapsackDP:
+    """
+    NumPy engine for 0/1 Knapsack using a rolling 1-D table
+    Each item updates the whole row with one vectorized np.maximum and
+    records which capacities took it in a bit-packed (n x W/8) matrix.
+    """
+    def __init__(self, items, capacity):
+        self.items = items
+        self.capacity = capacity
+        self.weights = np.array([item.weight for item in items], dtype=np.int64)
+        self.values = np.array([item.value for item in items])
+        self.took = np.zeros((len(items), capacity // 8 + 1), dtype=np.uint8)
+        self.best = 0
+
+    def solve(self):
+        """Fill the rolling row item by item, returns best value"""
+        row = np.zeros(self.capacity + 1, dtype=self.values.dtype)
+        took_row = np.zeros(self.capacity + 1, dtype=bool)
+
+        for i in range(len(self.items)):
+            weight = self.weights[i]
+            if weight > self.capacity:
+                continue
+
+            # Include item: shift row right by weight and add value
+            include = row[:self.capacity + 1 - weight] + self.values[i]
+            took_row[:] = False
+            took_row[weight:] = include > row[weight:]
+            np.maximum(row[weight:], include, out=row[weight:])
+            self.took[i] = np.packbits(took_row)
+
+        self.best = row[self.capacity].item()
+        return self.best
+
+    def took_item(self, i, w):
+        """Check bit (i, w) of the packed "took item" matrix"""
+        return (self.took[i, w >> 3] >> (7 - (w & 7))) & 1
+
+    def selected_items(self):
+        """Backtrack through the packed bits to find selected items"""
+        selected = []
+        w = self.capacity
+        for i in range(len(self.items) - 1, -1, -1):
+            if self.took_item(i, w):
+                selected.append(self.items[i])
+                w -= self.items[i].weight
+        return selected
+
+    def table(self):
+        """Materialize the full (n+1) x (W+1) DP table (small inputs only)"""
+        row = np.zeros(self.capacity + 1, dtype=self.values.dtype)
+        dp = [row.tolist()]
+        for i in range(len(self.items)):
+            weight = self.weights[i]
+            if weight <= self.capacity:
+                include = row[:self.capacity + 1 - weight] + self.values[i]
+                np.maximum(row[weight:], include, out=row[weight:])
+            dp.append(row.tolist())
+        return dp
+
+
 def knapsack_01_dp(items, capacity):
     """Dynamic Programming approach for 0/1 Knapsack (OPTIMAL)"""
-    n = len(items)
-    
-    # Create DP table
-    dp = [[0 for _ in range(capacity + 1)] for _ in range(n + 1)]
-    
-    # Build table bottom-up
-    for i in range(1, n + 1):
-        for w in range(1, capacity + 1):
-            if items[i - 1].weight <= w:
-                # Max of including or excluding current item
-                dp[i][w] = max(
-                    items[i - 1].value + dp[i - 1][w - items[i - 1].weight],
-                    dp[i - 1][w]
-                )
-            else:
-                dp[i][w] = dp[i - 1][w]
-    
-    # Backtrack to find selected items
-    selected = []
-    w = capacity
-    for i in range(n, 0, -1):
-        if dp[i][w] != dp[i - 1][w]:
-            selected.append(items[i - 1])
-            w -= items[i - 1].weight
-    
-    return dp[n][capacity], selected, dp
+    engine = KnapsackDP(items, capacity)
+    engine.solve()
+    return engine.best, engine.selected_items(), engine
 
 
-def print_dp_table(dp, items, capacity):
+def print_dp_table(engine, items, capacity, max_cells=2000):
     """Print DP table for visualization"""
+    if (len(items) + 1) * (capacity + 1) > max_cells:
+        print("\nDP Table too large to print")
+        return
+
+    dp = engine.table()
     print("\nDP Table:")
     print("     ", end="")
     for w in range(capacity + 1):
@@ -90,6 +141,206 @@ def print_dp_table(dp, items, capacity):
         print()
 
 
+def knapsack_01_sparse(items, capacity):
+    """
+    Sparse 0/1 Knapsack over Pareto-optimal (weight, value) states
+    Time and memory depend on the number of non-dominated states, not on capacity
+    Returns: (max_value, selected_items, front)
+    """
+    # Each state is (weight, value, chain); chain links (item index, previous chain)
+    states = [(0, 0, None)]
+
+    for i, item in enumerate(items):
+        shifted = [(w + item.weight, v + item.value, (i, chain))
+                   for w, v, chain in states if w + item.weight <= capacity]
+
+        # Merge both weight-sorted lists, keeping only strictly better values
+        merged = []
+        a = b = 0
+        while a < len(states) or b < len(shifted):
+            if b == len(shifted) or (a < len(states) and (
+                    states[a][0] < shifted[b][0] or
+                    (states[a][0] == shifted[b][0] and states[a][1] >= shifted[b][1]))):
+                state = states[a]
+                a += 1
+            else:
+                state = shifted[b]
+                b += 1
+            if not merged or state[1] > merged[-1][1]:
+                merged.append(state)
+        states = merged
+
+    # Heaviest state has the highest value on the Pareto front
+    _, max_value, chain = states[-1]
+    selected = []
+    while chain is not None:
+        i, chain = chain
+        selected.append(items[i])
+
+    front = [(w, v) for w, v, _ in states]
+    return max_value, selected, front
+
+
+# Dense DP is vectorized, so one table cell is far cheaper than one sparse state
+DENSE_MEMORY_LIMIT = 512 * 2**20
+SPARSE_STATE_COST = 30
+
+
+def estimate_pareto_states(items, capacity):
+    """Upper estimate of Pareto states from n, capacity and weight spread"""
+    weights = [item.weight for item in items]
+    max_fit = min(len(weights), capacity // min(weights))
+    spread = max(weights) - min(weights)
+
+    # Subsets of k items weigh between k*min and k*max
+    distinct_weights = (max_fit + 1) + spread * max_fit * (max_fit + 1) // 2
+    return min(distinct_weights, 2 ** max_fit, capacity + 1)
+
+
+def choose_knapsack_method(items, capacity):
+    """Pick "dense" (capacity-indexed table) or "sparse" (Pareto states)"""
+    n = len(items)
+    if n == 0 or capacity <= 0:
+        return "dense"
+
+    # Row of values plus one packed "took item" bit per cell
+    dense_cells = n * (capacity + 1)
+    if 8 * (capacity + 1) + dense_cells // 8 > DENSE_MEMORY_LIMIT:
+        return "sparse"
+
+    sparse_cost = n * estimate_pareto_states(items, capacity) * SPARSE_STATE_COST
+    return "sparse" if sparse_cost < dense_cells else "dense"
+
+
+def knapsack_01(items, capacity):
+    """
+    Optimal 0/1 Knapsack, dispatching between dense DP and sparse solver
+    Returns: (max_value, selected_items, method)
+    """
+    method = choose_knapsack_method(items, capacity)
+    if method == "sparse":
+        max_value, selected, _ = knapsack_01_sparse(items, capacity)
+    else:
+        max_value, selected, _ = knapsack_01_dp(items, capacity)
+    return max_value, selected, method
+
+
+class ItemCatalog:
+    """
+    Item objects prepared once for many fractional knapsack queries
+    Sorted by ratio once, with prefix sums of weight and value,
+    so each query is a binary search instead of a fresh sort
+    (Practical-4's FractionalCatalog is the same idea over ItemColumns arrays;
+    this one keeps the Item objects that Branch and Bound selects)
+    """
+    def __init__(self, items):
+        self.items = sorted(items, key=lambda x: x.ratio, reverse=True)
+        self.prefix_weight = [0] + list(accumulate(item.weight for item in self.items))
+        self.prefix_value = [0] + list(accumulate(item.value for item in self.items))
+        # float64 copies for query_many, built once instead of per call
+        self.weight_array = np.array([item.weight for item in self.items], dtype=np.float64)
+        self.value_array = np.array([item.value for item in self.items], dtype=np.float64)
+        self.prefix_weight_array = np.array(self.prefix_weight, dtype=np.float64)
+        self.prefix_value_array = np.array(self.prefix_value, dtype=np.float64)
+
+    def bound(self, level, weight, value, capacity):
+        """
+        Fractional (LP relaxation) bound for items[level:] given a partial solution
+        Same greedy as fractional_knapsack_greedy, done in O(log n)
+        """
+        # Last index k such that items[level:k] all fit whole
+        start = self.prefix_weight[level]
+        k = bisect_right(self.prefix_weight, start + capacity - weight) - 1
+        bound = value + self.prefix_value[k] - self.prefix_value[level]
+        if k < len(self.items):
+            remaining = capacity - weight - (self.prefix_weight[k] - start)
+            bound += self.items[k].value * (remaining / self.items[k].weight)
+        return bound
+
+    def query(self, capacity):
+        """Maximum fractional value for a single capacity"""
+        return self.bound(0, 0, 0, max(capacity, 0))
+
+    def query_many(self, capacities):
+        """Maximum fractional value for every capacity in a NumPy array"""
+        capacities = np.maximum(np.asarray(capacities, dtype=np.float64), 0.0)
+        n = len(self.items)
+        if n == 0:
+            return np.zeros_like(capacities)
+
+        # Items [0, k) fit whole; item k (if any) is taken partly
+        k = np.searchsorted(self.prefix_weight_array, capacities, side="right") - 1
+        critical = np.minimum(k, n - 1)
+        fraction = (capacities - self.prefix_weight_array[k]) / self.weight_array[critical]
+        partial = np.where(k < n, self.value_array[critical] * fraction, 0.0)
+        return self.prefix_value_array[k] + partial
+
+
+def knapsack_01_branch_bound(items, capacity, max_nodes=1_000_000, time_limit=None):
+    """
+    Best-first Branch and Bound for 0/1 Knapsack
+    Pruning bound is the fractional knapsack relaxation
+    Stops early after max_nodes expansions or time_limit seconds
+    Returns: (max_value, selected_items, gap, nodes_expanded)
+    gap = upper bound - max_value (0 when proven optimal)
+    """
+    catalog = ItemCatalog(items)
+    sorted_items = catalog.items
+    n = len(sorted_items)
+
+    # Greedy 0/1 solution is the starting incumbent
+    best_value, best_selected = knapsack_01_greedy(sorted_items, capacity)
+    best_chain = None
+
+    start = time.perf_counter()
+    tie = count()
+    root_bound = catalog.bound(0, 0, 0, capacity)
+    # Node: (-bound, tie, level, weight, value, chain of taken indices)
+    heap = [(-root_bound, next(tie), 0, 0, 0, None)]
+    nodes = 0
+
+    while heap:
+        neg_bound, _, level, weight, value, chain = heapq.heappop(heap)
+        if -neg_bound <= best_value:
+            # Best-first: no remaining node can beat the incumbent
+            heap = []
+            break
+        if nodes >= max_nodes or (time_limit is not None and
+                                  time.perf_counter() - start > time_limit):
+            heapq.heappush(heap, (neg_bound, next(tie), level, weight, value, chain))
+            break
+        nodes += 1
+
+        if level == n:
+            continue
+        item = sorted_items[level]
+
+        # Include item
+        if weight + item.weight <= capacity:
+            new_weight = weight + item.weight
+            new_value = value + item.value
+            new_chain = (level, chain)
+            if new_value > best_value:
+                best_value, best_chain, best_selected = new_value, new_chain, None
+            bound = catalog.bound(level + 1, new_weight, new_value, capacity)
+            if bound > best_value:
+                heapq.heappush(heap, (-bound, next(tie), level + 1, new_weight, new_value, new_chain))
+
+        # Exclude item
+        bound = catalog.bound(level + 1, weight, value, capacity)
+        if bound > best_value:
+            heapq.heappush(heap, (-bound, next(tie), level + 1, weight, value, chain))
+
+    if best_selected is None:
+        best_selected = []
+        while best_chain is not None:
+            level, best_chain = best_chain
+            best_selected.append(sorted_items[level])
+
+    upper_bound = max(best_value, -heap[0][0]) if heap else best_value
+    return best_value, best_selected, upper_bound - best_value, nodes
+
+
 def main():
     print("="*60)
     print("KNAPSACK COMPARISON: Greedy vs Dynamic Programming")
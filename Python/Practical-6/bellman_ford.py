@@ -2,7 +2,16 @@
 # Time Complexity: O(V * E)
 # Space Complexity: O(V)
 
+import heapq
+import os
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+INF = float('inf')
+
 
 class Edge:
     def __init__(self, src, dest, weight):
@@ -11,13 +20,36 @@ class Edge:
         self.weight = weight
 
 
-def bellman_ford(edges, num_vertices, num_edges, source):
+def bellman_ford(edges, num_vertices, num_edges, source, engine="scalar"):
     """
     Find shortest paths from source to all vertices using Bellman-Ford
+    engine: "scalar" (edge list loop), "csr" (early-exit passes),
+            "spfa" (queue mode) or "numpy" (vectorized passes)
     Returns: (distances, has_negative_cycle)
     """
+    tree, has_negative_cycle = shortest_path_tree(edges, num_vertices, source, engine)
+    return tree.dist, has_negative_cycle
+
+
+def shortest_path_tree(edges, num_vertices, source, engine="scalar"):
+    """
+    Bellman-Ford that also keeps each vertex's predecessor
+    Returns: (ShortestPathTree, has_negative_cycle)
+    """
+    if engine == "csr" or engine == "spfa":
+        mode = "passes" if engine == "csr" else "queue"
+        dist, pred, cycle = bellman_ford_fast(CSRGraph(num_vertices, edges), source, mode)
+        return ShortestPathTree(source, dist, pred), cycle is not None
+    if engine == "numpy":
+        arrays = EdgeArrays(num_vertices, edges)
+        dist, pred, has_negative_cycle = bellman_ford_numpy(arrays, source)
+        return ShortestPathTree(source, arrays.to_list(dist), pred.tolist()), has_negative_cycle
+    if engine != "scalar":
+        raise ValueError(f"Unknown engine: {engine}")
+
     # Initialize distances
     dist = [float('inf')] * num_vertices
+    pred = [-1] * num_vertices
     dist[source] = 0
     
     # Relax all edges V-1 times
@@ -26,6 +58,7 @@ def bellman_ford(edges, num_vertices, num_edges, source):
             if dist[edge.src] != float('inf') and \
                dist[edge.src] + edge.weight < dist[edge.dest]:
                 dist[edge.dest] = dist[edge.src] + edge.weight
+                pred[edge.dest] = edge.src
     
     # Check for negative-weight cycles
     has_negative_cycle = False
@@ -35,7 +68,495 @@ def bellman_ford(edges, num_vertices, num_edges, source):
             has_negative_cycle = True
             break
     
-    return dist, has_negative_cycle
+    return ShortestPathTree(source, dist, pred), has_negative_cycle
+
+
+class ShortestPathTree:
+    """
+    Distances plus predecessor array from a single-source run
+    pred[v] is the vertex before v on its shortest path (-1 for source/unreachable)
+    """
+    def __init__(self, source, dist, pred):
+        self.source = source
+        self.dist = dist
+        self.pred = pred
+
+    def path_to(self, target):
+        """Vertex sequence source -> target in O(path length), [] if unreachable"""
+        if self.dist[target] == INF:
+            return []
+        path = [target]
+        while target != self.source:
+            target = self.pred[target]
+            if target == -1 or len(path) > len(self.pred):
+                raise ValueError("Predecessors do not form a tree (negative cycle?)")
+            path.append(target)
+        path.reverse()
+        return path
+
+    def export(self):
+        """Tree as parallel NumPy arrays: (parent, distance)"""
+        return np.array(self.pred, dtype=np.int64), np.array(self.dist, dtype=np.float64)
+
+    def save(self, filename):
+        parent, distance = self.export()
+        np.savez(filename, source=self.source, parent=parent, distance=distance)
+
+    @classmethod
+    def load(cls, filename):
+        data = np.load(filename)
+        distance = data["distance"]
+        if np.all(np.isinf(distance) | (distance == np.round(distance))):
+            dist = [INF if d == INF else int(d) for d in distance.tolist()]
+        else:
+            dist = distance.tolist()
+        return cls(int(data["source"]), dist, data["parent"].tolist())
+
+
+class CSRGraph:
+    """
+    Compact adjacency list (CSR layout)
+    Edges leaving u are targets[offsets[u]:offsets[u + 1]] with matching weights
+    """
+    def __init__(self, num_vertices, edges):
+        self.num_vertices = num_vertices
+
+        # Count out-degrees, then prefix sums give each vertex's start offset
+        offsets = [0] * (num_vertices + 1)
+        for edge in edges:
+            offsets[edge.src + 1] += 1
+        for u in range(num_vertices):
+            offsets[u + 1] += offsets[u]
+
+        targets = [0] * len(edges)
+        weights = [0] * len(edges)
+        fill = offsets[:-1]
+        for edge in edges:
+            pos = fill[edge.src]
+            targets[pos] = edge.dest
+            weights[pos] = edge.weight
+            fill[edge.src] += 1
+
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+
+def find_negative_cycle(graph, dist, pred):
+    """
+    Keep relaxing until the predecessor graph closes a cycle, then return it
+    Only called once relaxation counts have proven a negative cycle exists
+    """
+    n = graph.num_vertices
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+
+    for _ in range(n + 1):
+        last = -1
+        for u in range(n):
+            du = dist[u]
+            if du == INF:
+                continue
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                if du + weights[k] < dist[v]:
+                    dist[v] = du + weights[k]
+                    pred[v] = u
+                    last = v
+        if last == -1:
+            return None
+
+        # Walking back n steps from a vertex relaxed in this pass lands on the cycle
+        v = last
+        for _ in range(n):
+            v = pred[v]
+            if v == -1:
+                break
+        if v == -1:
+            continue
+
+        cycle = [v]
+        u = pred[v]
+        while u != v:
+            cycle.append(u)
+            u = pred[u]
+        cycle.reverse()
+        return cycle
+
+    return None
+
+
+def bellman_ford_fast(graph, source, mode="passes"):
+    """
+    Bellman-Ford on a CSRGraph
+    mode="passes": full passes, stopping as soon as a pass relaxes nothing
+    mode="queue":  SPFA, only re-scans vertices whose distance changed,
+                   with the small-label-first heuristic
+    A vertex whose shortest path reaches V edges proves a negative cycle.
+    Returns: (distances, predecessors, negative_cycle) where negative_cycle
+             is a list of vertices in cycle order, or None
+    """
+    n = graph.num_vertices
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+
+    dist = [INF] * n
+    pred = [-1] * n
+    # Number of edges on the current path to each vertex
+    count = [0] * n
+    dist[source] = 0
+
+    if mode == "queue":
+        queue = deque([source])
+        in_queue = [False] * n
+        in_queue[source] = True
+        while queue:
+            u = queue.popleft()
+            in_queue[u] = False
+            du = dist[u]
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                if du + weights[k] < dist[v]:
+                    dist[v] = du + weights[k]
+                    pred[v] = u
+                    count[v] = count[u] + 1
+                    if count[v] >= n:
+                        return dist, pred, find_negative_cycle(graph, dist, pred)
+                    if not in_queue[v]:
+                        in_queue[v] = True
+                        # Small label first: promising vertices jump the queue
+                        if queue and dist[v] < dist[queue[0]]:
+                            queue.appendleft(v)
+                        else:
+                            queue.append(v)
+        return dist, pred, None
+
+    changed = True
+    while changed:
+        changed = False
+        for u in range(n):
+            du = dist[u]
+            if du == INF:
+                continue
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                if du + weights[k] < dist[v]:
+                    dist[v] = du + weights[k]
+                    pred[v] = u
+                    count[v] = count[u] + 1
+                    if count[v] >= n:
+                        return dist, pred, find_negative_cycle(graph, dist, pred)
+                    changed = True
+    return dist, pred, None
+
+
+class EdgeArrays:
+    """
+    Edge list as NumPy columns (src, dest, weight)
+    Edges are also grouped by destination once, so each pass can take the
+    minimum candidate per destination with one segmented reduction.
+    """
+    def __init__(self, num_vertices, edges):
+        self.num_vertices = num_vertices
+        self.src = np.array([edge.src for edge in edges], dtype=np.int64)
+        self.dest = np.array([edge.dest for edge in edges], dtype=np.int64)
+        self.weight = np.array([edge.weight for edge in edges]) if edges else \
+            np.zeros(0, dtype=np.int64)
+        self.integral = self.weight.dtype.kind in "iu"
+
+        self.order = np.argsort(self.dest, kind="stable")
+        self.heads, self.starts = np.unique(self.dest[self.order], return_index=True)
+        self.lengths = np.diff(np.append(self.starts, self.dest.size))
+
+    def to_list(self, dist):
+        """Distances as a Python list (ints stay ints, unreachable stays INF)"""
+        if not self.integral:
+            return dist.tolist()
+        return [INF if d == INF else int(d) for d in dist.tolist()]
+
+
+def bellman_ford_numpy(arrays, source):
+    """
+    Vectorized Bellman-Ford: every pass relaxes all edges at once
+    Candidates dist[src] + weight come from fancy indexing, and
+    np.minimum.reduceat takes the best candidate per destination.
+    Returns: (distances, predecessors, has_negative_cycle) as ndarrays + bool
+    """
+    dist = np.full(arrays.num_vertices, INF)
+    pred = np.full(arrays.num_vertices, -1, dtype=np.int64)
+    dist[source] = 0
+    if arrays.src.size == 0:
+        return dist, pred, False
+
+    positions = np.arange(arrays.src.size)
+    for _ in range(arrays.num_vertices - 1):
+        candidates = dist[arrays.src] + arrays.weight
+        sorted_candidates = candidates[arrays.order]
+        best = np.minimum.reduceat(sorted_candidates, arrays.starts)
+        improved = best < dist[arrays.heads]
+        # Early exit: a pass that relaxes nothing means distances are final
+        if not improved.any():
+            return dist, pred, False
+
+        # First edge in each destination group that achieves the minimum
+        hits = np.where(sorted_candidates == np.repeat(best, arrays.lengths),
+                        positions, positions.size)
+        first = np.minimum.reduceat(hits, arrays.starts)
+
+        dist[arrays.heads[improved]] = best[improved]
+        pred[arrays.heads[improved]] = arrays.src[arrays.order[first[improved]]]
+
+    # One more pass still improving means a negative cycle
+    candidates = dist[arrays.src] + arrays.weight
+    has_negative_cycle = bool((candidates < dist[arrays.dest]).any())
+    return dist, pred, has_negative_cycle
+
+
+def dijkstra(graph, source):
+    """Heap-based Dijkstra on a CSRGraph with non-negative weights"""
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    dist = [INF] * graph.num_vertices
+    dist[source] = 0
+    heap = [(0, source)]
+    while heap:
+        du, u = heapq.heappop(heap)
+        if du > dist[u]:
+            continue
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            if du + weights[k] < dist[v]:
+                dist[v] = du + weights[k]
+                heapq.heappush(heap, (dist[v], v))
+    return dist
+
+
+# Per-process state for Johnson workers (set once by the pool initializer)
+_johnson_state = {}
+
+
+def _init_johnson_worker(graph, potentials, filename):
+    _johnson_state["graph"] = graph
+    _johnson_state["potentials"] = potentials
+    _johnson_state["matrix"] = np.load(filename, mmap_mode="r+")
+
+
+def _johnson_rows(sources):
+    """Run Dijkstra from each source and write real distances into the matrix"""
+    graph = _johnson_state["graph"]
+    h = np.asarray(_johnson_state["potentials"], dtype=np.float64)
+    matrix = _johnson_state["matrix"]
+    for u in sources:
+        # Undo reweighting: d(u, v) = d'(u, v) - h[u] + h[v]
+        matrix[u] = np.asarray(dijkstra(graph, u), dtype=np.float64) - h[u] + h
+    matrix.flush()
+    return len(sources)
+
+
+def johnson_all_pairs(edges, num_vertices, filename, workers=None, chunk_size=64):
+    """
+    Johnson's all-pairs shortest paths
+    1. Bellman-Ford once from a virtual source (0-weight edge to every vertex)
+       gives potentials h[v]
+    2. Reweight w'(u, v) = w(u, v) + h[u] - h[v] >= 0
+    3. Dijkstra from every source, spread over a process pool
+    Distances are written to an on-disk memory-mapped .npy matrix.
+    Returns: DistanceMatrix
+    """
+    virtual = num_vertices
+    augmented = edges + [Edge(virtual, v, 0) for v in range(num_vertices)]
+    h, _, cycle = bellman_ford_fast(CSRGraph(num_vertices + 1, augmented), virtual, "queue")
+    if cycle is not None:
+        raise ValueError(f"Graph contains a negative cycle: {cycle}")
+    h = h[:num_vertices]
+
+    reweighted = [Edge(e.src, e.dest, e.weight + h[e.src] - h[e.dest]) for e in edges]
+    graph = CSRGraph(num_vertices, reweighted)
+
+    matrix = np.lib.format.open_memmap(filename, mode="w+", dtype=np.float64,
+                                       shape=(num_vertices, num_vertices))
+    del matrix
+
+    chunks = [range(i, min(i + chunk_size, num_vertices))
+              for i in range(0, num_vertices, chunk_size)]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        _init_johnson_worker(graph, h, filename)
+        for chunk in chunks:
+            _johnson_rows(chunk)
+        _johnson_state.clear()
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_johnson_worker,
+                                 initargs=(graph, h, filename)) as pool:
+            list(pool.map(_johnson_rows, chunks))
+
+    return DistanceMatrix(filename)
+
+
+class DistanceMatrix:
+    """
+    All-pairs distances memory-mapped from disk
+    Lookups are O(1) and only touch the pages they need.
+    """
+    def __init__(self, filename):
+        self.filename = filename
+        self.matrix = np.load(filename, mmap_mode="r")
+
+    def distance(self, u, v):
+        d = self.matrix[u, v].item()
+        return d if d == INF or d != int(d) else int(d)
+
+    def row(self, u):
+        """All distances from u (reads a single row)"""
+        return self.matrix[u]
+
+
+class DynamicShortestPaths:
+    """
+    Single-source distances kept up to date while edges change
+    Insertions / weight decreases: relax the edge and propagate with a work queue.
+    Weight increases / deletions: only the subtree hanging below the edge in the
+    shortest-path tree is reset and recomputed.
+    Each update returns (and stores in last_relaxations) the number of edge
+    relaxations it needed; a full Bellman-Ford rerun needs up to V × E.
+    """
+    def __init__(self, edges, num_vertices, source):
+        self.num_vertices = num_vertices
+        self.source = source
+        # Adjacency maps: out_edges[u][v] = weight, in_edges[v][u] = weight
+        self.out_edges = [{} for _ in range(num_vertices)]
+        self.in_edges = [{} for _ in range(num_vertices)]
+        for edge in edges:
+            if edge.weight < self.out_edges[edge.src].get(edge.dest, INF):
+                self.out_edges[edge.src][edge.dest] = edge.weight
+                self.in_edges[edge.dest][edge.src] = edge.weight
+
+        tree, has_negative_cycle = shortest_path_tree(edges, num_vertices, source, "spfa")
+        if has_negative_cycle:
+            raise ValueError("Graph contains a negative cycle")
+        self.dist = tree.dist
+        self.pred = tree.pred
+        self.children = [set() for _ in range(num_vertices)]
+        for v, u in enumerate(self.pred):
+            if u != -1:
+                self.children[u].add(v)
+        # Number of edges on the current path to each vertex
+        self.count = [0] * num_vertices
+        stack = [source]
+        while stack:
+            u = stack.pop()
+            for v in self.children[u]:
+                self.count[v] = self.count[u] + 1
+                stack.append(v)
+        self.last_relaxations = 0
+
+    def tree(self):
+        return ShortestPathTree(self.source, self.dist, self.pred)
+
+    def _set(self, v, dist, pred, undo, count=None):
+        if undo is not None:
+            undo.append((v, self.dist[v], self.pred[v], self.count[v]))
+        if self.pred[v] != -1:
+            self.children[self.pred[v]].discard(v)
+        if pred != -1:
+            self.children[pred].add(v)
+        self.dist[v] = dist
+        self.pred[v] = pred
+        if count is None:
+            count = self.count[pred] + 1 if pred != -1 else 0
+        self.count[v] = count
+
+    def _propagate(self, queue, watch=-1, undo=None):
+        """
+        SPFA from the vertices in queue, returns (relaxations, cycle_found)
+        If watch gets improved, its new path runs through itself: negative cycle.
+        A path reaching V edges (as in bellman_ford_fast) means any other cycle.
+        """
+        relaxations = 0
+        in_queue = set(queue)
+        while queue:
+            u = queue.popleft()
+            in_queue.discard(u)
+            du = self.dist[u]
+            for v, weight in self.out_edges[u].items():
+                relaxations += 1
+                if du + weight < self.dist[v]:
+                    if v == watch or self.count[u] + 1 >= self.num_vertices:
+                        return relaxations, True
+                    self._set(v, du + weight, u, undo)
+                    if v not in in_queue:
+                        in_queue.add(v)
+                        queue.append(v)
+        return relaxations, False
+
+    def set_edge(self, u, v, weight):
+        """Insert edge u -> v or change its weight, returns relaxations used"""
+        old_weight = self.out_edges[u].get(v, INF)
+        self.out_edges[u][v] = weight
+        self.in_edges[v][u] = weight
+
+        if weight <= old_weight:
+            relaxations = self._decrease(u, v, weight, old_weight)
+        else:
+            relaxations = self._increase(u, v)
+        self.last_relaxations = relaxations
+        return relaxations
+
+    def add_edge(self, u, v, weight):
+        """Insert edge u -> v (keeps the lighter one if it already exists)"""
+        return self.set_edge(u, v, min(weight, self.out_edges[u].get(v, INF)))
+
+    def remove_edge(self, u, v):
+        """Delete edge u -> v, returns relaxations used"""
+        del self.out_edges[u][v]
+        del self.in_edges[v][u]
+        relaxations = self._increase(u, v)
+        self.last_relaxations = relaxations
+        return relaxations
+
+    def _decrease(self, u, v, weight, old_weight):
+        if not self.dist[u] + weight < self.dist[v]:
+            return 1
+
+        undo = []
+        self._set(v, self.dist[u] + weight, u, undo)
+        relaxations, cycle = self._propagate(deque([v]), watch=u, undo=undo)
+        if cycle:
+            # Roll back every change and the edge itself
+            for x, dist, pred, count in reversed(undo):
+                self._set(x, dist, pred, None, count)
+            if old_weight == INF:
+                del self.out_edges[u][v]
+                del self.in_edges[v][u]
+            else:
+                self.out_edges[u][v] = old_weight
+                self.in_edges[v][u] = old_weight
+            raise ValueError(f"Edge {u} -> {v} ({weight}) creates a negative cycle")
+        return relaxations + 1
+
+    def _increase(self, u, v):
+        if self.pred[v] != u:
+            # Edge is not in the shortest-path tree, no distance changes
+            return 0
+
+        # Collect the subtree below v and disconnect it
+        affected = []
+        stack = [v]
+        while stack:
+            x = stack.pop()
+            affected.append(x)
+            stack.extend(self.children[x])
+        for x in affected:
+            self._set(x, INF, -1, None)
+
+        # Best entry into each affected vertex from the rest of the tree
+        relaxations = 0
+        for x in affected:
+            for y, weight in self.in_edges[x].items():
+                relaxations += 1
+                if self.dist[y] + weight < self.dist[x]:
+                    self._set(x, self.dist[y] + weight, y, None)
+
+        queue = deque(x for x in affected if self.dist[x] != INF)
+        more, _ = self._propagate(queue)
+        return relaxations + more
 
 
 def main():
@@ -63,8 +584,9 @@ def main():
     print("="*60)
     
     start_time = time.perf_counter()
-    dist, has_negative_cycle = bellman_ford(edges, num_vertices, num_edges, source)
+    tree, has_negative_cycle = shortest_path_tree(edges, num_vertices, source)
     end_time = time.perf_counter()
+    dist = tree.dist
     
     # Output
     if has_negative_cycle:
@@ -72,14 +594,15 @@ def main():
         print("Shortest paths are not defined.")
     else:
         print("\nShortest distances from source vertex", source)
-        print("-" * 30)
-        print(f"{'Vertex':<10} {'Distance':<10}")
-        print("-" * 30)
+        print("-" * 40)
+        print(f"{'Vertex':<10} {'Distance':<10} {'Path':<20}")
+        print("-" * 40)
         for i in range(num_vertices):
             if dist[i] == float('inf'):
-                print(f"{i:<10} {'INF':<10}")
+                print(f"{i:<10} {'INF':<10} {'-':<20}")
             else:
-                print(f"{i:<10} {dist[i]:<10}")
+                path = " -> ".join(map(str, tree.path_to(i)))
+                print(f"{i:<10} {dist[i]:<10} {path:<20}")
     
     # Complexity analysis
     duration_us = (end_time - start_time) * 1_000_000
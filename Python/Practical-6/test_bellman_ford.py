@@ -0,0 +1,173 @@
+# Tests: every Bellman-Ford engine, Johnson and the dynamic updates against
+# the scalar edge-list loop
+# Run: python -m pytest -q (from Python/Practical-6)
+
+import random
+
+import pytest
+
+from bellman_ford import (INF, DynamicShortestPaths, Edge, bellman_ford, johnson_all_pairs,
+                          shortest_path_tree)
+
+ENGINES = ["scalar", "csr", "spfa", "numpy"]
+SEEDS = range(25)
+
+
+def random_graph(seed, cycles_allowed):
+    """
+    Seeded random digraph with negative edges (and parallel edges / self-loops)
+    Without cycles_allowed weights are w + p[u] - p[v] with w >= 0 for random
+    potentials p: edges can be negative but every cycle has weight >= 0.
+    Returns: (edges, num_vertices, source)
+    """
+    rng = random.Random(seed)
+    n = rng.randint(1, 30)
+    m = rng.randint(0, 4 * n)
+    potential = [rng.randint(-20, 20) for _ in range(n)]
+    edges = []
+    for _ in range(m):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if cycles_allowed:
+            weight = rng.randint(-5, 15)
+        else:
+            weight = rng.randint(0, 15) + potential[u] - potential[v]
+        edges.append(Edge(u, v, weight))
+    return edges, n, rng.randrange(n)
+
+
+def path_cost(edges, path):
+    """Cost of a vertex path using the cheapest edge between consecutive vertices"""
+    cheapest = {}
+    for e in edges:
+        key = (e.src, e.dest)
+        cheapest[key] = min(cheapest.get(key, INF), e.weight)
+    return sum(cheapest[(u, v)] for u, v in zip(path, path[1:]))
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_distances_match_scalar(engine, seed):
+    edges, n, source = random_graph(seed, cycles_allowed=False)
+    expected, expected_cycle = bellman_ford(edges, n, len(edges), source)
+    dist, has_cycle = bellman_ford(edges, n, len(edges), source, engine=engine)
+    assert not expected_cycle
+    assert has_cycle == expected_cycle
+    assert dist == expected
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_negative_cycle_flag_matches_scalar(engine, seed):
+    edges, n, source = random_graph(seed, cycles_allowed=True)
+    _, expected_cycle = bellman_ford(edges, n, len(edges), source)
+    _, has_cycle = bellman_ford(edges, n, len(edges), source, engine=engine)
+    assert has_cycle == expected_cycle
+
+
+def test_negative_cycle_graphs_are_generated():
+    """Guard: the cycle test above must see both outcomes"""
+    flags = {bellman_ford(*graph[:2], len(graph[0]), graph[2])[1]
+             for graph in (random_graph(seed, cycles_allowed=True) for seed in SEEDS)}
+    assert flags == {True, False}
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_path_to_costs_match_distances(engine, seed):
+    edges, n, source = random_graph(seed, cycles_allowed=False)
+    tree, has_cycle = shortest_path_tree(edges, n, source, engine)
+    assert not has_cycle
+    for target in range(n):
+        path = tree.path_to(target)
+        if tree.dist[target] == INF:
+            assert path == []
+        else:
+            assert path[0] == source and path[-1] == target
+            assert path_cost(edges, path) == tree.dist[target]
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        bellman_ford([Edge(0, 1, 1)], 2, 1, 0, engine="gpu")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("seed", range(8))
+def test_johnson_matches_bellman_ford(tmp_path, workers, seed):
+    edges, n, _ = random_graph(seed, cycles_allowed=False)
+    matrix = johnson_all_pairs(edges, n, str(tmp_path / "dist.npy"), workers, chunk_size=4)
+    for u in range(n):
+        expected, _ = bellman_ford(edges, n, len(edges), u)
+        assert [matrix.distance(u, v) for v in range(n)] == expected
+
+
+def test_johnson_rejects_negative_cycle(tmp_path):
+    edges = [Edge(0, 1, 1), Edge(1, 2, -2), Edge(2, 1, 1)]
+    with pytest.raises(ValueError):
+        johnson_all_pairs(edges, 3, str(tmp_path / "dist.npy"), workers=1)
+
+
+def test_dynamic_rejects_negative_cycle():
+    with pytest.raises(ValueError):
+        DynamicShortestPaths([Edge(0, 1, 1), Edge(1, 0, -2)], 2, 0)
+
+
+def test_dynamic_many_in_edges_is_not_a_cycle():
+    """A vertex improved more than V times in one update, without any cycle"""
+    edges = [Edge(0, 1, 1000), Edge(1, 3, 0)]
+    for i in range(30):
+        u = 4 + i
+        edges += [Edge(1, u, 0), Edge(u, 2, 30 - i), Edge(3, u, -60)]
+    paths = DynamicShortestPaths(edges, 34, 0)
+    paths.set_edge(0, 1, 0)
+    edges[0] = Edge(0, 1, 0)
+    expected, _ = bellman_ford(edges, 34, len(edges), 0)
+    assert paths.dist == expected
+    assert paths.dist[2] == -59
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_dynamic_updates_match_fresh_run(seed):
+    edges, n, source = random_graph(seed, cycles_allowed=False)
+    rng = random.Random(seed)
+    paths = DynamicShortestPaths(edges, n, source)
+    current = {}
+    for e in edges:
+        current[(e.src, e.dest)] = min(current.get((e.src, e.dest), INF), e.weight)
+
+    for _ in range(60):
+        op = rng.choice(["insert", "decrease", "increase", "delete"])
+        if op in ("decrease", "increase", "delete") and not current:
+            op = "insert"
+        if op == "insert":
+            key = (rng.randrange(n), rng.randrange(n))
+            weight = rng.randint(-10, 20)
+        else:
+            key = rng.choice(sorted(current))
+            weight = current[key] + rng.randint(1, 10) * (-1 if op == "decrease" else 1)
+
+        updated = dict(current)
+        if op == "delete":
+            del updated[key]
+        else:
+            updated[key] = weight
+        update_edges = [Edge(u, v, w) for (u, v), w in updated.items()]
+        expected, has_cycle = bellman_ford(update_edges, n, len(update_edges), source)
+
+        before = list(paths.dist)
+        if has_cycle:
+            with pytest.raises(ValueError):
+                paths.set_edge(*key, weight)
+            # Rolled back: distances and edges as before the update
+            assert paths.dist == before
+            continue
+        if op == "delete":
+            paths.remove_edge(*key)
+        else:
+            paths.set_edge(*key, weight)
+        current = updated
+        assert paths.dist == expected
+        tree = paths.tree()
+        for v in range(n):
+            if paths.dist[v] != INF:
+                assert path_cost(update_edges, tree.path_to(v)) == paths.dist[v]
@@ -2,6 +2,11 @@
 # Time Complexity: O(N!)
 # Space Complexity: O(N)
 
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 solution_count = 0
 
 
@@ -23,7 +28,7 @@ def is_safe(board, row, col):
     return True
 
 
-def solve_n_queens(board, row, n):
+def solve_n_queens(board, row, n, show=True):
     """
     Solve N-Queens using backtracking
     Returns True if solution exists
@@ -33,7 +38,8 @@ def solve_n_queens(board, row, n):
     # Base case: All queens placed
     if row == n:
         solution_count += 1
-        print_solution(board, n, solution_count)
+        if show:
+            print_solution(board, n, solution_count)
         return True
     
     found_solution = False
@@ -45,7 +51,7 @@ def solve_n_queens(board, row, n):
             board[row] = col
             
             # Recurse to next row
-            if solve_n_queens(board, row + 1, n):
+            if solve_n_queens(board, row + 1, n, show):
                 found_solution = True
             
             # Backtrack (remove queen)
@@ -54,23 +60,290 @@ def solve_n_queens(board, row, n):
     return found_solution
 
 
+def count_completions(full, cols, left, right):
+    """
+    Count ways to finish a board from bitmask state
+    cols:  columns already taken
+    left:  squares attacked along "/" diagonals in the current row
+    right: squares attacked along "\\" diagonals in the current row
+    """
+    if cols == full:
+        return 1
+    
+    total = 0
+    free = full & ~(cols | left | right)
+    while free:
+        bit = free & -free  # Lowest free square
+        free ^= bit
+        total += count_completions(full, cols | bit,
+                                   ((left | bit) << 1) & full, (right | bit) >> 1)
+    return total
+
+
+def count_n_queens(n):
+    """
+    Count all N-Queens solutions using bitmasks
+    Mirror symmetry: only the left half of the first row is searched
+    (plus the middle column for odd N) and the half count is doubled.
+    """
+    if n == 0:
+        return 1
+    full = (1 << n) - 1
+    
+    total = 0
+    for col in range(n // 2):
+        bit = 1 << col
+        total += count_completions(full, bit, (bit << 1) & full, bit >> 1)
+    total *= 2
+    
+    if n % 2 == 1:
+        bit = 1 << (n // 2)
+        total += count_completions(full, bit, (bit << 1) & full, bit >> 1)
+    return total
+
+
+def bitmask_boards(n, first_cols):
+    """
+    Yield every solution whose first queen is in first_cols
+    The same board list is reused between solutions (copy it to keep one)
+    """
+    full = (1 << n) - 1
+    board = [-1] * n
+    
+    def place(row, cols, left, right):
+        if row == n:
+            yield board
+            return
+        free = full & ~(cols | left | right)
+        while free:
+            bit = free & -free
+            free ^= bit
+            board[row] = bit.bit_length() - 1
+            yield from place(row + 1, cols | bit,
+                             ((left | bit) << 1) & full, (right | bit) >> 1)
+    
+    for col in first_cols:
+        bit = 1 << col
+        board[0] = col
+        yield from place(1, bit, (bit << 1) & full, bit >> 1)
+
+
+def symmetries(board):
+    """All 8 rotations / reflections of a board"""
+    n = len(board)
+    images = []
+    current = list(board)
+    for _ in range(4):
+        images.append(tuple(current))
+        images.append(tuple(n - 1 - c for c in current))
+        # Rotate 90 degrees: queen (r, c) moves to (c, n - 1 - r)
+        rotated = [0] * n
+        for r, c in enumerate(current):
+            rotated[c] = n - 1 - r
+        current = rotated
+    return images
+
+
+def count_n_queens_unique(n):
+    """
+    Count solutions up to all 8 rotations / reflections
+    A board is counted only if it is the smallest of its 8 images; that image
+    always has its first queen in the left half, so only that half is searched.
+    Returns: (unique_count, total_count)
+    """
+    if n == 0:
+        return 1, 1
+    unique = 0
+    total = 0
+    for board in bitmask_boards(n, range((n + 1) // 2)):
+        images = symmetries(board)
+        if tuple(board) == min(images):
+            unique += 1
+            # Each distinct image is a separate solution
+            total += len(set(images))
+    return unique, total
+
+
+def prefix_tasks(n, depth):
+    """
+    Expand the first `depth` rows into independent (weight, cols, left, right) tasks
+    First row uses mirror symmetry: left-half columns have weight 2, middle weight 1
+    """
+    full = (1 << n) - 1
+    tasks = []
+    
+    def expand(row, weight, cols, left, right):
+        if row == depth or cols == full:
+            tasks.append((weight, cols, left, right))
+            return
+        free = full & ~(cols | left | right)
+        while free:
+            bit = free & -free
+            free ^= bit
+            expand(row + 1, weight, cols | bit, ((left | bit) << 1) & full, (right | bit) >> 1)
+    
+    for col in range((n + 1) // 2):
+        bit = 1 << col
+        weight = 1 if n % 2 == 1 and col == n // 2 else 2
+        expand(1, weight, bit, (bit << 1) & full, bit >> 1)
+    return tasks
+
+
+def count_tasks(n, tasks):
+    """Worker: total weighted completions for a chunk of prefix tasks"""
+    full = (1 << n) - 1
+    return sum(weight * count_completions(full, cols, left, right)
+               for weight, cols, left, right in tasks)
+
+
+def count_n_queens_parallel(n, workers=None, depth=None, chunk_size=8):
+    """
+    Count N-Queens solutions on a process pool
+    Prefix tasks are handed out in small chunks and collected as they finish,
+    so a worker that gets easy subtrees just takes more chunks.
+    """
+    if n < 2:
+        return count_n_queens(n)
+    workers = workers or os.cpu_count() or 1
+    depth = depth or min(n, 4)
+    
+    tasks = prefix_tasks(n, depth)
+    chunks = [tasks[i:i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+    if workers == 1:
+        return sum(count_tasks(n, chunk) for chunk in chunks)
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(count_tasks, n, chunk) for chunk in chunks]
+        return sum(future.result() for future in as_completed(futures))
+
+
+def benchmark_parallel(n, max_workers=None):
+    """Print time and speedup of count_n_queens_parallel for 1..max_workers workers"""
+    max_workers = max_workers or os.cpu_count() or 1
+    results = []
+    
+    print(f"\nParallel {n}-Queens benchmark")
+    print("-" * 40)
+    print(f"{'Workers':<10} {'Time (s)':<12} {'Speedup':<10}")
+    print("-" * 40)
+    for workers in range(1, max_workers + 1):
+        start = time.perf_counter()
+        count = count_n_queens_parallel(n, workers)
+        elapsed = time.perf_counter() - start
+        speedup = results[0][1] / elapsed if results else 1.0
+        results.append((workers, elapsed, speedup))
+        print(f"{workers:<10} {elapsed:<12.3f} {speedup:<10.2f}")
+    print("-" * 40)
+    print(f"Solutions: {count}")
+    return results
+
+
+def iter_n_queens(n, resume_after=None):
+    """
+    Generate every solution as a compact `bytes` column vector
+    (byte i = column of the queen in row i), in lexicographic order.
+    resume_after: a previously yielded solution; the search restarts right
+    after it, so the last solution seen is all the state needed to resume.
+    """
+    if n == 0:
+        if resume_after is None:
+            yield b""
+        return
+    
+    full = (1 << n) - 1
+    board = array('B', [0] * n)
+    # Bitmask state per row: columns, both diagonals, untried free squares
+    cols = [0] * n
+    left = [0] * n
+    right = [0] * n
+    free = [0] * n
+    free[0] = full
+    row = 0
+    
+    if resume_after is not None:
+        # Replay the saved board, marking every column up to it as tried
+        for row, col in enumerate(resume_after):
+            if row > 0:
+                bit = 1 << resume_after[row - 1]
+                cols[row] = cols[row - 1] | bit
+                left[row] = ((left[row - 1] | bit) << 1) & full
+                right[row] = (right[row - 1] | bit) >> 1
+            available = full & ~(cols[row] | left[row] | right[row])
+            free[row] = available & ~((2 << col) - 1)
+            board[row] = col
+        row = n - 1
+    
+    while row >= 0:
+        if not free[row]:
+            row -= 1
+            continue
+        bit = free[row] & -free[row]
+        free[row] ^= bit
+        board[row] = bit.bit_length() - 1
+        
+        if row == n - 1:
+            yield bytes(board)
+            continue
+        
+        cols[row + 1] = cols[row] | bit
+        left[row + 1] = ((left[row] | bit) << 1) & full
+        right[row + 1] = (right[row] | bit) >> 1
+        free[row + 1] = full & ~(cols[row + 1] | left[row + 1] | right[row + 1])
+        row += 1
+
+
+def write_solutions(n, filename, resume=False, buffer_size=1 << 20):
+    """
+    Stream all solutions to a binary file, n bytes per solution
+    Nothing is kept in memory; with resume=True an existing file is continued
+    after its last complete record.
+    Returns: number of solutions written by this call
+    """
+    last = None
+    mode = "wb"
+    if resume and n > 0 and os.path.exists(filename):
+        size = os.path.getsize(filename) // n * n
+        if size:
+            with open(filename, "r+b") as f:
+                f.truncate(size)  # Drop a partial record from an interrupted run
+                f.seek(size - n)
+                last = f.read(n)
+        mode = "ab"
+    
+    written = 0
+    with open(filename, mode, buffering=buffer_size) as f:
+        for solution in iter_n_queens(n, resume_after=last):
+            f.write(solution)
+            written += 1
+    return written
+
+
+def read_solutions(filename, n, buffer_size=1 << 20):
+    """Generate solutions back from a file written by write_solutions"""
+    with open(filename, "rb", buffering=buffer_size) as f:
+        while True:
+            record = f.read(n)
+            if len(record) < n or not record:
+                return
+            yield record
+
+
+def render_board(solution):
+    """ASCII board for one solution"""
+    n = len(solution)
+    return "\n".join(" ".join("Q" if solution[i] == j else "." for j in range(n))
+                     for i in range(n))
+
+
 def print_solution(board, n, sol_num):
     """Print the board configuration"""
     print(f"\nSolution {sol_num}:")
     print("-" * (n * 2 + 1))
-    for i in range(n):
-        for j in range(n):
-            if board[i] == j:
-                print("Q", end=" ")
-            else:
-                print(".", end=" ")
-        print()
+    print(render_board(board[:n]))
     print("-" * (n * 2 + 1))
 
 
 def main():
-    global solution_count
-    
     print("="*60)
     print("N-QUEENS PROBLEM (Backtracking)")
     print("="*60)
@@ -84,14 +357,26 @@ def main():
         print("Solutions exist for N = 1 or N >= 4")
         return
     
-    # Initialize board
-    board = [-1] * n
-    solution_count = 0
+    show = input("Print every solution? (y/n): ").strip().lower() != "n"
+    if not show:
+        # Counting only: bitmask engine, nothing printed during the search
+        unique, total = count_n_queens_unique(n) if n <= 12 else (None, count_n_queens(n))
+        print("\n" + "="*60)
+        print(f"Total solutions found: {total}")
+        if unique is not None:
+            print(f"Unique solutions (up to rotation/reflection): {unique}")
+        print("="*60)
+        return
     
     print(f"\nSolving {n}-Queens Problem using Backtracking...\n")
     
-    # Solve
-    if not solve_n_queens(board, 0, n):
+    # Printing is just one consumer of the solution stream
+    solution_count = 0
+    for solution in iter_n_queens(n):
+        solution_count += 1
+        print_solution(solution, n, solution_count)
+    
+    if solution_count == 0:
         print("\nNo solution exists")
     else:
         print("\n" + "="*60)
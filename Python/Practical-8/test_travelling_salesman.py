@@ -0,0 +1,72 @@
+# Tests: Held-Karp against Branch and Bound (every bound) on random matrices
+# Run: python -m pytest -q (from Python/Practical-8)
+
+import random
+
+import pytest
+
+from travelling_salesman import BOUNDS, INF, TSPSolver, held_karp
+from tsp_heuristics import tour_cost
+
+SEEDS = range(15)
+SHAPES = ["symmetric", "asymmetric", "missing"]
+
+
+def random_matrix(seed, shape):
+    """
+    Seeded random cost matrix with 1..8 cities
+    symmetric:  cost[i][j] == cost[j][i]
+    asymmetric: independent costs in each direction
+    missing:    asymmetric with about a quarter of the edges absent (0)
+    """
+    rng = random.Random(seed)
+    n = rng.randint(1, 8)
+    cost = [[0 if i == j else rng.randint(1, 100) for j in range(n)] for i in range(n)]
+    if shape == "symmetric":
+        cost = [[cost[min(i, j)][max(i, j)] for j in range(n)] for i in range(n)]
+    elif shape == "missing":
+        for i in range(n):
+            for j in range(n):
+                if rng.random() < 0.25:
+                    cost[i][j] = 0
+    return cost
+
+
+def check_tour(cost, best_cost, best_path):
+    """A returned tour visits every city once from city 0 and costs best_cost"""
+    if best_cost == INF:
+        assert best_path == []
+        return
+    n = len(cost)
+    assert best_path[0] == best_path[-1] == 0
+    assert sorted(best_path[:-1]) == list(range(n))
+    assert tour_cost(cost, best_path) == best_cost
+
+
+@pytest.mark.parametrize("bound", list(BOUNDS))
+@pytest.mark.parametrize("shape", SHAPES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_held_karp_matches_branch_and_bound(bound, shape, seed):
+    cost = random_matrix(seed, shape)
+    dp_cost, dp_path = held_karp(cost)
+    bb_cost, bb_path, gap, _ = TSPSolver(cost, bound=bound).solve()
+    assert dp_cost == bb_cost
+    assert gap == 0
+    check_tour(cost, dp_cost, dp_path)
+    check_tour(cost, bb_cost, bb_path)
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_held_karp_memmap_matches_ram(tmp_path, shape, seed):
+    cost = random_matrix(seed, shape)
+    dp_cost, dp_path = held_karp(cost, memmap_path=str(tmp_path / "dp.dat"))
+    assert dp_cost == held_karp(cost)[0]
+    check_tour(cost, dp_cost, dp_path)
+
+
+def test_held_karp_no_tour():
+    # City 2 cannot be left
+    cost = [[0, 1, 1], [1, 0, 1], [0, 0, 0]]
+    assert held_karp(cost) == (INF, [])
+    assert TSPSolver(cost).solve()[0] == INF
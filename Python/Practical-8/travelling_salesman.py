@@ -2,124 +2,574 @@
 # Time Complexity: O(n^2 * 2^n) average
 # Space Complexity: O(n^2)
 
+import heapq
+import multiprocessing
+import os
 import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import count
 
-final_path = []
-visited = []
-final_cost = sys.maxsize
+import numpy as np
 
+from tsp_heuristics import heuristic_tsp, tour_cost
 
-def first_min(cost, i, n):
-    """Find minimum edge cost from vertex i"""
-    min_cost = sys.maxsize
-    for k in range(n):
-        if cost[i][k] < min_cost and i != k:
-            min_cost = cost[i][k]
-    return min_cost
+INF = float('inf')
 
 
-def second_min(cost, i, n):
-    """Find second minimum edge cost from vertex i"""
-    first = sys.maxsize
-    second = sys.maxsize
-    
-    for j in range(n):
-        if i == j:
-            continue
-        
-        if cost[i][j] <= first:
-            second = first
-            first = cost[i][j]
-        elif cost[i][j] <= second and cost[i][j] != first:
-            second = cost[i][j]
-    
-    return second
+def cheapest_edges(cost, n):
+    """
+    Two cheapest edges touching each vertex (leaving or entering it)
+    A tour enters and leaves every vertex once, so these give a lower bound
+    that also holds for asymmetric matrices. 0 means no direct path.
+    Returns: (first, second) lists
+    """
+    first = [INF] * n
+    second = [INF] * n
+    for i in range(n):
+        for j in range(n):
+            if i == j:
+                continue
+            for c in (cost[i][j], cost[j][i]):
+                if c == 0:
+                    continue
+                if c < first[i]:
+                    first[i], second[i] = c, first[i]
+                elif c < second[i]:
+                    second[i] = c
+    return first, second
 
 
-def tsp_recursive(cost, curr_bound, curr_weight, level, curr_path, n):
+class EdgeBound:
     """
-    Solve TSP using Branch and Bound with LC strategy
+    Half the two cheapest edges at every vertex that still needs them
+    Cheap (O(1) per child) but weak on asymmetric or clustered matrices.
+    State per node: doubled cost still missing for unvisited cities.
     """
-    global final_cost, final_path, visited
-    
-    # Base case: All cities visited
-    if level == n:
-        # Check if there's an edge from last city to first
-        if cost[curr_path[level - 1]][curr_path[0]] != 0:
-            curr_res = curr_weight + cost[curr_path[level - 1]][curr_path[0]]
-            
-            # Update final result if better solution found
-            if curr_res < final_cost:
-                final_path = curr_path.copy()
-                final_path.append(curr_path[0])  # Return to start
-                final_cost = curr_res
-        return
-    
-    # Try all unvisited cities
-    for i in range(n):
-        if cost[curr_path[level - 1]][i] != 0 and not visited[i]:
-            temp = curr_bound
-            curr_weight += cost[curr_path[level - 1]][i]
-            
-            # Update bound
-            if level == 1:
-                curr_bound -= (
-                    (first_min(cost, curr_path[level - 1], n) + 
-                     first_min(cost, i, n)) / 2
-                )
-            else:
-                curr_bound -= (
-                    (second_min(cost, curr_path[level - 1], n) + 
-                     first_min(cost, i, n)) / 2
-                )
-            
-            # Branch only if bound + current weight is promising
-            if curr_bound + curr_weight < final_cost:
-                curr_path[level] = i
-                visited[i] = True
-                
-                # Recurse to next level
-                tsp_recursive(cost, curr_bound, curr_weight, level + 1, curr_path, n)
-            
-            # Backtrack
-            curr_weight -= cost[curr_path[level - 1]][i]
-            curr_bound = temp
-            
-            # Reset visited array
-            visited = [False] * n
-            for j in range(level):
-                visited[curr_path[j]] = True
-
-
-def solve_tsp(cost, n):
+    def __init__(self, solver):
+        self.solver = solver
+
+    def root(self):
+        first, second = self.solver.first, self.solver.second
+        rest = sum(first[v] + second[v] for v in range(1, self.solver.n))
+        return (rest + first[0] + second[0]) / 2, rest
+
+    def child(self, state, weight, last, city, mask, best_cost):
+        first, second = self.solver.first, self.solver.second
+        # Every unvisited city still needs two edges; the path ends need one each
+        rest = state - first[city] - second[city]
+        return weight + (rest + first[city] + first[0]) / 2, rest
+
+
+class ReducedMatrixBound:
+    """
+    Classic LC bound: reduce every row and column of the cost matrix to a zero
+    minimum; the total reduction is a lower bound. Each child copies its
+    parent's reduced matrix, blocks the used row / column and reduces again.
+    State per node: (bound, reduced matrix)
+    """
+    def __init__(self, solver):
+        matrix = np.array(solver.cost, dtype=np.float64)
+        matrix[matrix == 0] = INF
+        self.matrix = matrix
+        self.n = solver.n
+
+    @staticmethod
+    def reduce(matrix, rows, cols):
+        """Reduce the given rows and columns in place, returns the total (INF if stuck)"""
+        row_min = matrix[rows].min(axis=1)
+        if np.isinf(row_min).any():
+            return INF
+        matrix[rows] -= row_min[:, None]
+        col_min = matrix[:, cols].min(axis=0)
+        if np.isinf(col_min).any():
+            return INF
+        matrix[:, cols] -= col_min
+        return row_min.sum() + col_min.sum()
+
+    def root(self):
+        matrix = self.matrix.copy()
+        everyone = np.arange(self.n)
+        bound = self.reduce(matrix, everyone, everyone)
+        return bound, (bound, matrix)
+
+    def child(self, state, weight, last, city, mask, best_cost):
+        parent_bound, parent = state
+        matrix = parent.copy()
+        step = matrix[last, city]
+        matrix[last, :] = INF
+        matrix[:, city] = INF
+        matrix[city, 0] = INF
+        rest = [v for v in range(1, self.n) if not mask >> v & 1]
+        # Cities still to be left, and cities still to be entered
+        bound = parent_bound + step + self.reduce(matrix, rest + [city], rest + [0])
+        return bound, (bound, matrix)
+
+
+class OneTreeBound:
+    """
+    Held-Karp 1-tree bound with Lagrangian penalties (subgradient iterations)
+    The rest of a tour (city -> unvisited -> 0) is a spanning tree whose inner
+    vertices have degree 2; penalties pi push the minimum spanning tree towards
+    that shape. Any pi gives a valid bound, so children start from their
+    parent's pi and only run a few iterations.
+    Uses min(cost[i][j], cost[j][i]): valid for asymmetric matrices, tight on
+    symmetric ones. State per node: penalty vector pi.
+    """
+    def __init__(self, solver, root_iterations=50, child_iterations=5):
+        matrix = np.array(solver.cost, dtype=np.float64)
+        matrix[matrix == 0] = INF
+        self.sym = np.minimum(matrix, matrix.T)
+        self.n = solver.n
+        self.root_iterations = root_iterations
+        self.child_iterations = child_iterations
+
+    @staticmethod
+    def spanning(w, cycle):
+        """
+        Minimum spanning tree (Prim) on w; with cycle=True vertex 0 is left out
+        of the tree and joined by its two cheapest edges (a 1-tree).
+        Returns: (total weight, degree of each vertex)
+        """
+        k = len(w)
+        degree = np.zeros(k)
+        start = 1 if cycle else 0
+        total = 0.0
+        in_tree = np.zeros(k, dtype=bool)
+        in_tree[:start + 1] = True
+        dist = w[start].copy()
+        parent = np.full(k, start)
+        for _ in range(k - start - 1):
+            v = int(np.where(in_tree, INF, dist).argmin())
+            if dist[v] == INF:
+                return INF, degree
+            total += dist[v]
+            degree[v] += 1
+            degree[parent[v]] += 1
+            in_tree[v] = True
+            closer = w[v] < dist
+            dist[closer] = w[v][closer]
+            parent[closer] = v
+        if cycle:
+            ends = np.resize(np.argsort(w[0, 1:])[:2] + 1, 2)
+            total += w[0, ends].sum()
+            degree[0] += 2
+            np.add.at(degree, ends, 1)
+        return total, degree
+
+    def optimise(self, vertices, targets, pi, iterations, upper, cycle=False):
+        """Subgradient ascent on pi (updated in place), returns the best bound seen"""
+        best = -INF
+        scale = 1.0
+        for _ in range(iterations):
+            p = pi[vertices]
+            w = self.sym[np.ix_(vertices, vertices)] + p[:, None] + p[None, :]
+            total, degree = self.spanning(w, cycle)
+            if total == INF:
+                return INF
+            value = total - (p * targets).sum()
+            best = max(best, value)
+            g = degree - targets
+            norm = (g * g).sum()
+            if norm == 0 or best >= upper:
+                break  # tree is already a tour / path, or the node is pruned
+            target = upper if upper != INF else 1.05 * abs(value) + 1
+            pi[vertices] += scale * (target - value) / norm * g
+            scale *= 0.9
+        return best
+
+    def root(self):
+        pi = np.zeros(self.n)
+        vertices = np.arange(self.n)
+        targets = np.full(self.n, 2.0)
+        bound = self.optimise(vertices, targets, pi, self.root_iterations, INF, cycle=True)
+        return bound, pi
+
+    def child(self, state, weight, last, city, mask, best_cost):
+        pi = state.copy()
+        rest = [v for v in range(1, self.n) if not mask >> v & 1]
+        vertices = np.array([city] + rest + [0])
+        targets = np.full(len(vertices), 2.0)
+        targets[0] = targets[-1] = 1.0
+        bound = self.optimise(vertices, targets, pi, self.child_iterations, best_cost - weight)
+        return weight + bound, pi
+
+
+BOUNDS = {"edges": EdgeBound, "reduced": ReducedMatrixBound, "one_tree": OneTreeBound}
+
+
+class TSPSolver:
+    """
+    Reentrant least-cost (best-first) Branch and Bound for TSP
+    All search state lives on the object, so independent solves can run
+    side by side. Visited cities are a bitmask.
+    bound:     lower-bound strategy, one of BOUNDS ("edges", "reduced", "one_tree")
+    max_nodes: stop after expanding this many nodes
+    max_open:  stop when this many live nodes are waiting (memory budget)
+    """
+    def __init__(self, cost, max_nodes=None, max_open=None, bound="edges"):
+        self.cost = cost
+        self.n = len(cost)
+        self.max_nodes = max_nodes
+        self.max_open = max_open
+        self.first, self.second = cheapest_edges(cost, self.n)
+        self.integral = all(isinstance(c, int) for row in cost for c in row)
+        self.strategy = BOUNDS[bound](self)
+        self.nodes_expanded = 0
+
+    def round_bound(self, bound):
+        """Tour costs are integers on integer matrices, so bounds can be rounded up"""
+        if self.integral and bound != INF:
+            # Small tolerance: penalty-based bounds carry float rounding noise
+            bound = -(-(bound - 1e-6) // 1)
+        return bound
+
+    def solve(self, upper_bound=INF, initial_tour=None, prefixes=None, shared=None,
+              ties=False, stop=None, shared_path=None):
+        """
+        Search from city 0, pruning against upper_bound (a known tour cost)
+        initial_tour: closed tour used as the starting incumbent (warm start);
+        it is returned unchanged if the search finds nothing cheaper.
+        prefixes: only search tours starting with these paths (default: (0,))
+        shared:   multiprocessing.Value holding the best cost across processes;
+                  pruning reads it and cheaper tours are written back
+        ties:     return the lexicographically smallest of the cheapest tours
+                  (deterministic across runs); a node whose bound equals the
+                  best cost survives only if its prefix could still lead to a
+                  smaller path: prune when (bound, prefix) > (best, best prefix)
+        stop:     multiprocessing.Value; once it is set the search stops early
+        shared_path: multiprocessing.Array (n + 1 ints, -1 = none yet) holding
+                  the path of the shared best cost, guarded by shared's lock
+        Returns: (best_cost, best_path, gap, nodes_expanded)
+        best_cost is INF when no tour (cheaper than upper_bound) exists;
+        gap > 0 means a budget (or stop) ended the search early, and then
+        self.frontier lists the prefixes still waiting to be searched.
+        """
+        n, cost, strategy = self.n, self.cost, self.strategy
+        self.nodes_expanded = 0
+        self.frontier = []
+        if n == 1:
+            return 0, [0, 0], 0, 0
+
+        best_cost = upper_bound
+        best_path = []
+        if initial_tour and tour_cost(cost, initial_tour) < best_cost:
+            best_cost = tour_cost(cost, initial_tour)
+            best_path = list(initial_tour)
+        if INF in self.second:
+            # Some city cannot be both entered and left
+            return INF, [], 0, 0
+        tie = count()
+        limit = best_cost
+        # [INF] sorts after every real path: no known path prunes nothing on ties
+        limit_path = best_path or [INF]
+
+        def pruned(bound, chain=None):
+            if bound == INF:
+                return True
+            if not ties or bound != limit:
+                return bound > limit if ties else bound >= limit
+            if chain is None:
+                return False
+            prefix = self.unwind(chain)[:-1]
+            return prefix > limit_path[:len(prefix)]
+
+        def poll_shared():
+            with shared.get_lock():
+                value = shared.value
+                path = list(shared_path) if shared_path is not None else [-1]
+            return value, (path if path[0] >= 0 else [INF])
+
+        def publish():
+            with shared.get_lock():
+                value = shared.value
+                path = list(shared_path) if shared_path is not None else [-1]
+                if (best_cost, best_path) < (value, path if path[0] >= 0 else [INF]):
+                    shared.value = best_cost
+                    if shared_path is not None:
+                        shared_path[:] = best_path
+
+        # Node: (bound, -depth, tie, weight, last, mask, bound state, path chain)
+        heap = []
+        root_bound, root_state = strategy.root()
+        for prefix in prefixes or [(0,)]:
+            node = self.prefix_node(prefix, root_bound, root_state, limit)
+            if node is not None:
+                heap.append(node[:2] + (next(tie),) + node[2:])
+        heapq.heapify(heap)
+
+        while heap:
+            if self.nodes_expanded % 64 == 0:
+                # Other processes: poll now and then, the lock is not free
+                if shared is not None:
+                    limit, limit_path = min((limit, limit_path), poll_shared())
+                if stop is not None and stop.value and self.nodes_expanded:
+                    break
+            if pruned(heap[0][0]):
+                heap = []
+                break
+            if (self.max_nodes is not None and self.nodes_expanded >= self.max_nodes) or \
+               (self.max_open is not None and len(heap) > self.max_open):
+                break
+            bound, neg_depth, _, weight, last, mask, state, chain = heapq.heappop(heap)
+            if ties and pruned(bound, chain):
+                # The incumbent improved since this node was pushed
+                continue
+            self.nodes_expanded += 1
+            depth = -neg_depth
+
+            for i in range(1, n):
+                if mask >> i & 1 or cost[last][i] == 0:
+                    continue
+                new_weight = weight + cost[last][i]
+
+                if depth + 1 == n:
+                    # Last city: close the tour back to city 0
+                    if cost[i][0] == 0 or pruned(new_weight + cost[i][0], (i, chain)):
+                        continue
+                    path = self.unwind((i, chain))
+                    if (new_weight + cost[i][0], path) < (best_cost, best_path or [INF]):
+                        best_cost, best_path = new_weight + cost[i][0], path
+                        limit, limit_path = min((limit, limit_path), (best_cost, best_path))
+                        if shared is not None:
+                            publish()
+                    continue
+
+                new_mask = mask | 1 << i
+                bound, new_state = strategy.child(state, new_weight, last, i, new_mask, limit)
+                bound = self.round_bound(bound)
+                if not pruned(bound, (i, chain)):
+                    heapq.heappush(heap, (bound, -(depth + 1), next(tie), new_weight,
+                                          i, new_mask, new_state, (i, chain)))
+
+        # Smallest live bound is the best any unexplored tour could do
+        gap = best_cost - heap[0][0] if heap else 0
+        self.frontier = [tuple(self.unwind(node[-1])[:-1]) for node in heap]
+        return best_cost, best_path, gap, self.nodes_expanded
+
+    def prefix_node(self, prefix, root_bound, root_state, limit):
+        """Heap node (without tie counter) for a partial path from city 0, or None"""
+        bound, state = self.round_bound(root_bound), root_state
+        weight, mask, chain = 0, 1, (0, None)
+        for last, city in zip(prefix, prefix[1:]):
+            if mask >> city & 1 or self.cost[last][city] == 0:
+                return None
+            weight += self.cost[last][city]
+            mask |= 1 << city
+            bound, state = self.strategy.child(state, weight, last, city, mask, limit)
+            bound = self.round_bound(bound)
+            chain = (city, chain)
+        return (bound, -len(prefix), weight, prefix[-1], mask, state, chain)
+
+    @staticmethod
+    def unwind(chain):
+        """Turn a (city, parent chain) link list into a closed tour"""
+        if not chain:
+            return []
+        path = []
+        while chain is not None:
+            city, chain = chain
+            path.append(city)
+        path.reverse()
+        path.append(path[0])
+        return path
+
+
+def solve_tsp(cost, n, max_nodes=None, max_open=None, warm_start=True, bound="edges"):
     """
     Main function to solve TSP
+    warm_start: seed the search with the 2-opt / Or-opt heuristic tour, so
+    branches no better than it are pruned from the first node
+    Returns: (final_cost, final_path), final_cost is sys.maxsize if no tour exists
     """
-    global final_cost, final_path, visited
-    
-    # Initialize
-    curr_path = [-1] * (n + 1)
-    visited = [False] * n
-    
-    # Calculate initial lower bound
-    curr_bound = 0
-    for i in range(n):
-        curr_bound += first_min(cost, i, n) + second_min(cost, i, n)
-    
-    # Round up if odd
-    curr_bound = (curr_bound // 2) if curr_bound % 2 == 0 else (curr_bound // 2) + 1
-    
-    # Start from vertex 0
-    visited[0] = True
-    curr_path[0] = 0
-    
-    # Solve recursively
-    tsp_recursive(cost, curr_bound, 0, 1, curr_path, n)
+    cost = [row[:n] for row in cost[:n]]
+    solver = TSPSolver(cost, max_nodes, max_open, bound)
+    initial_tour = heuristic_tsp(cost)[1] if warm_start else None
+    final_cost, final_path, _, _ = solver.solve(initial_tour=initial_tour)
+    if final_cost == INF:
+        return sys.maxsize, []
+    return final_cost, final_path
+
+
+# Per-process state for parallel workers (set once by the pool initializer)
+_tsp_state = {}
+
+
+def _init_tsp_worker(cost, bound, shared, shared_path, split):
+    _tsp_state["solver"] = TSPSolver(cost, bound=bound)
+    _tsp_state["shared"] = shared
+    _tsp_state["shared_path"] = shared_path
+    _tsp_state["split"] = split
+
+
+def _solve_prefixes(prefixes):
+    """Search the subtrees under prefixes; unfinished ones come back as a frontier"""
+    solver = _tsp_state["solver"]
+    best_cost, best_path, _, nodes = solver.solve(prefixes=prefixes, shared=_tsp_state["shared"],
+                                                  ties=True, stop=_tsp_state["split"],
+                                                  shared_path=_tsp_state["shared_path"])
+    return best_cost, best_path, nodes, solver.frontier
+
+
+def split_prefixes(cost, depth):
+    """All paths from city 0 visiting depth more cities, in lexicographic order"""
+    n = len(cost)
+    prefixes = [(0,)]
+    for _ in range(depth):
+        prefixes = [p + (i,) for p in prefixes for i in range(1, n)
+                    if i not in p and cost[p[-1]][i] != 0]
+    return prefixes
+
+
+def chunked(items, parts):
+    """Split items into at most parts contiguous chunks"""
+    size = -(-len(items) // max(parts, 1))
+    return [items[k:k + size] for k in range(0, len(items), size)]
+
+
+def solve_tsp_parallel(cost, workers=None, depth=None, bound="edges", warm_start=True):
+    """
+    Branch and Bound on a process pool with a shared incumbent
+    The tree is split into prefixes at a shallow depth. The best cost found so
+    far lives in a multiprocessing.Value, so every worker prunes against the
+    global incumbent. When workers sit idle, a split flag asks the running
+    tasks to stop and hand back their open nodes, which are re-queued across
+    the pool.
+    Equal-cost tours are kept and the lexicographically smallest path wins, so
+    the result does not depend on scheduling.
+    Returns: (best_cost, best_path, nodes_expanded), best_cost is INF if no tour exists
+    """
+    n = len(cost)
+    workers = workers or os.cpu_count() or 1
+    if n <= 3:
+        best_cost, best_path, _, nodes = TSPSolver(cost, bound=bound).solve(ties=True)
+        return best_cost, best_path, nodes
+    if depth is None:
+        depth = 1
+        while depth < n - 2 and len(split_prefixes(cost, depth)) < 4 * workers:
+            depth += 1
+    prefixes = split_prefixes(cost, min(depth, n - 2))
+
+    best = (INF, [])
+    if warm_start:
+        tour_cost_, tour = heuristic_tsp(cost)
+        if tour_cost_ != INF:
+            best = (tour_cost_, tour)
+    shared = multiprocessing.Value("d", best[0])
+    # Incumbent path next to the cost, updated under the same lock
+    shared_path = multiprocessing.Array("i", best[1] or [-1] * (n + 1), lock=False)
+    split = multiprocessing.Value("b", 0)
+    nodes = 0
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_tsp_worker,
+                             initargs=(cost, bound, shared, shared_path, split)) as pool:
+        pending = {pool.submit(_solve_prefixes, chunk)
+                   for chunk in chunked(prefixes, 4 * workers)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                best_cost, best_path, expanded, frontier = future.result()
+                nodes += expanded
+                if best_path and (best_cost, best_path) < best:
+                    best = (best_cost, best_path)
+                if frontier:
+                    # Rebalance: spread the unfinished subtrees over the pool
+                    for chunk in chunked(frontier, workers):
+                        pending.add(pool.submit(_solve_prefixes, chunk))
+            # Ask running tasks to split only while some worker has nothing to do
+            split.value = 0 < len(pending) < workers
+
+    return best[0], best[1], nodes
+
+
+def compare_bounds(cost, warm_start=True):
+    """
+    Solve once with every bounding strategy
+    Returns: {strategy: (best_cost, nodes_expanded)}
+    """
+    initial_tour = heuristic_tsp(cost)[1] if warm_start else None
+    results = {}
+    for name in BOUNDS:
+        best_cost, _, _, nodes = TSPSolver(cost, bound=name).solve(initial_tour=initial_tour)
+        results[name] = (best_cost, nodes)
+    return results
+
+
+def held_karp(cost, memmap_path=None):
+    """
+    Held-Karp dynamic programming for TSP (exact, O(n^2 * 2^n) always)
+    dp[mask, j] = cheapest path from city 0 through the cities in mask ending
+    at city j + 1, where mask uses one bit per city 1..n-1.
+    Masks are processed in layers of equal popcount; each layer is one
+    vectorized min-reduction per end city.
+    memmap_path: keep the DP table in a memory-mapped file instead of RAM
+    Returns: (best_cost, best_path), best_cost is INF if no tour exists
+    """
+    n = len(cost)
+    if n == 1:
+        return 0, [0, 0]
+    m = n - 1
+
+    # Missing edges (0 off the diagonal) cost infinity
+    c = np.array(cost, dtype=np.float64)
+    c[c == 0] = INF
+    to_city = c[1:, 1:]  # to_city[i, j] = cost from city i+1 to city j+1
+
+    shape = (1 << m, m)
+    if memmap_path is None:
+        dp = np.full(shape, INF)
+    else:
+        dp = np.memmap(memmap_path, dtype=np.float64, mode="w+", shape=shape)
+        dp[:] = INF
+    # Compact parent table: previous end city for each state
+    parent = np.zeros(shape, dtype=np.uint8 if m <= 256 else np.uint16)
+
+    for j in range(m):
+        dp[1 << j, j] = c[0, j + 1]
+
+    # Group masks by popcount
+    masks = np.arange(1 << m, dtype=np.int64)
+    popcount = np.zeros(1 << m, dtype=np.int64)
+    for bit in range(m):
+        popcount += (masks >> bit) & 1
+    order = np.argsort(popcount, kind="stable")
+    bounds = np.searchsorted(popcount[order], np.arange(m + 2))
+
+    for size in range(2, m + 1):
+        layer = order[bounds[size]:bounds[size + 1]]
+        for j in range(m):
+            ending = layer[(layer >> j) & 1 == 1]
+            previous = ending ^ (1 << j)
+            # Best previous end city i for every mask at once
+            candidates = dp[previous] + to_city[:, j]
+            best = candidates.argmin(axis=1)
+            dp[ending, j] = candidates[np.arange(len(ending)), best]
+            parent[ending, j] = best
+
+    full = (1 << m) - 1
+    closing = dp[full] + c[1:, 0]
+    last = int(closing.argmin())
+    best_cost = closing[last]
+    if best_cost == INF:
+        return INF, []
+
+    # Walk the parent table back from the full mask
+    path = []
+    mask = full
+    while mask:
+        path.append(last + 1)
+        previous = int(parent[mask, last])
+        mask ^= 1 << last
+        last = previous
+    path.append(0)
+    path.reverse()
+    path.append(0)
+
+    if all(isinstance(x, int) for row in cost for x in row):
+        best_cost = int(best_cost)
+    return best_cost, path
 
 
 def main():
-    global final_cost, final_path
-    
     print("="*60)
     print("TRAVELLING SALESMAN PROBLEM - Branch and Bound (LC)")
     print("="*60)
@@ -153,10 +603,7 @@ def main():
     print("SOLVING TSP...")
     print("="*60)
     
-    final_cost = sys.maxsize
-    final_path = []
-    
-    solve_tsp(cost, n)
+    final_cost, final_path = solve_tsp(cost, n)
     
     # Output
     print("\n" + "="*60)
@@ -170,6 +617,10 @@ def main():
         print("\nPath taken:")
         path_str = " -> ".join(map(str, final_path))
         print(path_str)
+
+        print("\nNodes expanded per bounding strategy:")
+        for name, (_, nodes) in compare_bounds(cost).items():
+            print(f"  {name:10}: {nodes}")
     
     print("\n" + "="*60)
     print("COMPLEXITY ANALYSIS:")
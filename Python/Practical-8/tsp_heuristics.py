@@ -0,0 +1,162 @@
+# Heuristic TSP: Nearest Neighbour construction + 2-opt / Or-opt local search
+# Time Complexity: O(n^2) construction, local search usually near O(n * K) per round
+# Space Complexity: O(n * K) for neighbour lists
+
+from collections import deque
+
+INF = float('inf')
+
+
+def distance_matrix(cost):
+    """
+    Copy of cost where missing edges (0 off the diagonal) get a large penalty
+    The penalty is bigger than any real tour, so local search removes such
+    edges first, without the INF - INF problems of real infinity.
+    """
+    n = len(cost)
+    penalty = n * max((c for row in cost for c in row), default=0) + 1
+    return [[cost[i][j] if i == j or cost[i][j] != 0 else penalty for j in range(n)]
+            for i in range(n)]
+
+
+def tour_cost(cost, tour):
+    """Cost of a closed tour [0, ..., 0]; INF if it uses a missing edge"""
+    total = 0
+    for k in range(len(tour) - 1):
+        c = cost[tour[k]][tour[k + 1]]
+        if c == 0 and tour[k] != tour[k + 1]:
+            return INF
+        total += c
+    return total
+
+
+def nearest_neighbour_tour(dist, start=0):
+    """Open tour (no repeated start) built by always moving to the closest unvisited city"""
+    n = len(dist)
+    visited = [False] * n
+    visited[start] = True
+    tour = [start]
+    for _ in range(n - 1):
+        last = dist[tour[-1]]
+        city = min((j for j in range(n) if not visited[j]), key=lambda j: last[j])
+        visited[city] = True
+        tour.append(city)
+    return tour
+
+
+def neighbour_lists(dist, k):
+    """K closest cities to each city (by the cheaper direction)"""
+    n = len(dist)
+    return [sorted((j for j in range(n) if j != i),
+                   key=lambda j: min(dist[i][j], dist[j][i]))[:k]
+            for i in range(n)]
+
+
+class LocalSearch:
+    """
+    2-opt and Or-opt improvement of an open tour, driven by don't-look bits
+    Only cities whose surroundings changed are re-examined, and each city only
+    tries moves towards its K nearest neighbours.
+    Works on asymmetric matrices: reversed segments are priced in reverse.
+    """
+    def __init__(self, dist, tour, neighbours=10):
+        self.dist = dist
+        self.n = len(tour)
+        self.tour = list(tour)
+        self.near = neighbour_lists(dist, neighbours)
+        self._index()
+
+    def _index(self):
+        """Positions plus forward / backward prefix costs along the tour"""
+        n, tour, dist = self.n, self.tour, self.dist
+        self.pos = [0] * n
+        self.forward = [0] * (n + 1)
+        self.backward = [0] * (n + 1)
+        for k in range(n):
+            a, b = tour[k], tour[(k + 1) % n]
+            self.pos[a] = k
+            self.forward[k + 1] = self.forward[k] + dist[a][b]
+            self.backward[k + 1] = self.backward[k] + dist[b][a]
+
+    def _two_opt_gain(self, i, j):
+        """Gain of reversing tour[i+1..j] (0 <= i < j < n)"""
+        tour, dist = self.tour, self.dist
+        a, b, c, e = tour[i], tour[i + 1], tour[j], tour[(j + 1) % self.n]
+        old = dist[a][b] + self.forward[j] - self.forward[i + 1] + dist[c][e]
+        new = dist[a][c] + self.backward[j] - self.backward[i + 1] + dist[b][e]
+        return old - new
+
+    def _try_two_opt(self, city):
+        i = self.pos[city]
+        for other in self.near[city]:
+            j = self.pos[other]
+            lo, hi = (i, j) if i < j else (j, i)
+            if hi - lo < 2:
+                continue
+            if self._two_opt_gain(lo, hi) > 0:
+                touched = [self.tour[lo], self.tour[lo + 1], self.tour[hi],
+                           self.tour[(hi + 1) % self.n]]
+                self.tour[lo + 1:hi + 1] = reversed(self.tour[lo + 1:hi + 1])
+                self._index()
+                return touched
+        return None
+
+    def _try_or_opt(self, city):
+        """Move a segment of 1-3 cities starting at city next to a near neighbour"""
+        n, tour, dist = self.n, self.tour, self.dist
+        i = self.pos[city]
+        for length in (1, 2, 3):
+            if i + length >= n or i == 0:
+                break
+            first, last = tour[i], tour[i + length - 1]
+            prev, nxt = tour[i - 1], tour[(i + length) % n]
+            removed = dist[prev][first] + dist[last][nxt] - dist[prev][nxt]
+            for other in self.near[first]:
+                k = self.pos[other]
+                if i - 1 <= k < i + length:
+                    continue
+                after = tour[(k + 1) % n]
+                added = dist[other][first] + dist[last][after] - dist[other][after]
+                if removed - added > 0:
+                    segment = tour[i:i + length]
+                    rest = tour[:i] + tour[i + length:]
+                    k = rest.index(other)
+                    self.tour = rest[:k + 1] + segment + rest[k + 1:]
+                    self._index()
+                    return [prev, nxt, first, last, other, after]
+        return None
+
+    def run(self):
+        """Improve until no city can find a move, returns the open tour"""
+        if self.n < 4:
+            return self.tour
+        queue = deque(self.tour)
+        active = [True] * self.n
+        while queue:
+            city = queue.popleft()
+            active[city] = False
+            touched = self._try_two_opt(city) or self._try_or_opt(city)
+            if touched:
+                # Clear don't-look bits around the change
+                for c in touched + [city]:
+                    if not active[c]:
+                        active[c] = True
+                        queue.append(c)
+        return self.tour
+
+
+def heuristic_tsp(cost, neighbours=10):
+    """
+    Fast approximate TSP: nearest neighbour tour improved by 2-opt and Or-opt
+    Returns: (tour_cost, closed tour starting and ending at city 0)
+    tour_cost is INF if no tour without missing edges was found
+    """
+    n = len(cost)
+    if n == 1:
+        return 0, [0, 0]
+    dist = distance_matrix(cost)
+    tour = LocalSearch(dist, nearest_neighbour_tour(dist), neighbours).run()
+
+    start = tour.index(0)
+    tour = tour[start:] + tour[:start] + [0]
+    return tour_cost(cost, tour), tour